@@ -0,0 +1,80 @@
+"""
+Benchmark del índice de similitud de docentes (búsqueda de reemplazos)
+Mide construcción del índice y latencia de consulta con 100.000 docentes sintéticos
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import AREAS, AREA_TO_KEY, COLUMNAS_EXPERIENCIA
+from src.vecinos_docentes import IndiceSimilitudDocentes
+
+# ============================================
+# CONFIGURACIÓN
+# ============================================
+NUM_DOCENTES = 100_000
+NUM_CONSULTAS = 1_000
+K = 10
+
+rng = np.random.default_rng(42)
+
+
+def generar_docentes_sinteticos(n):
+    """Genera un DataFrame con las columnas que usa el índice"""
+    datos = {
+        'id_docente': [f'DOC_{i:06d}' for i in range(1, n + 1)],
+        'area_principal': rng.choice(AREAS, n),
+        'carga_actual_creditos': rng.integers(0, 15, n),
+        'horas_disponibles_semana': rng.integers(15, 40, n),
+        'puede_horario_noche': rng.choice([0, 1], n, p=[0.40, 0.60]),
+    }
+    for key in AREA_TO_KEY.values():
+        datos[f'comp_{key}'] = rng.uniform(1.0, 5.0, n).round(2)
+        datos[f'score_herramientas_{key}'] = rng.uniform(0.5, 5.0, n).round(2)
+        datos[f'score_enfoque_{key}'] = rng.choice([0, 1], n)
+        datos[f'idoneidad_{key}'] = rng.uniform(20, 95, n).round(2)
+    for col in COLUMNAS_EXPERIENCIA:
+        datos[col] = rng.integers(0, 20, n)
+    return pd.DataFrame(datos)
+
+
+def medir_consultas(indice, ids, **filtros):
+    inicio = time.perf_counter()
+    for id_docente in ids:
+        indice.buscar_reemplazos(id_docente, k=K, **filtros)
+    return (time.perf_counter() - inicio) / len(ids) * 1000
+
+
+print("=" * 70)
+print(f"⏱️ BENCHMARK ÍNDICE DE SIMILITUD - {NUM_DOCENTES:,} DOCENTES")
+print("=" * 70)
+
+df = generar_docentes_sinteticos(NUM_DOCENTES)
+
+inicio = time.perf_counter()
+indice = IndiceSimilitudDocentes(df)
+tiempo_construccion = time.perf_counter() - inicio
+print(f"\n✅ Índice construido en {tiempo_construccion:.2f} s ({len(indice.columnas)} dimensiones)")
+
+ids_consulta = rng.choice(df['id_docente'].to_numpy(), NUM_CONSULTAS, replace=False)
+
+escenarios = {
+    'Sin filtros': {},
+    'Filtro por área': {'area': 'Software'},
+    'Área + disponibilidad noche': {'area': 'Software', 'disponibilidad': {'puede_horario_noche': 1}},
+    'Área + disponibilidad + carga ≤ 2': {
+        'area': 'Matemáticas',
+        'disponibilidad': {'horas_disponibles_semana': 30},
+        'carga_maxima': 2
+    },
+}
+
+print(f"\n📊 Latencia media por consulta (k={K}, {NUM_CONSULTAS:,} consultas):")
+for nombre, filtros in escenarios.items():
+    print(f"   - {nombre}: {medir_consultas(indice, ids_consulta, **filtros):.2f} ms")
@@ -0,0 +1,56 @@
+"""
+Ejecuta el pipeline multi-carrera en uno o varios nodos
+
+Uso (cada nodo, sobre un directorio compartido):
+    python scripts/ejecutar_shards.py --artefactos models/modelo.pkl --ejecucion 2025_1 --nodo 0 --total-nodos 3 --salida /compartido/shards
+Combinar cuando todos los nodos terminaron:
+    python scripts/ejecutar_shards.py --ejecucion 2025_1 --salida /compartido/shards --combinar
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_loader import cargar_datasets
+from src.sharding import MATERIAS_POR_SHARD, combinar_directorio, ejecutar_nodo
+
+parser = argparse.ArgumentParser(description='Pipeline de recomendación particionado por carrera')
+parser.add_argument('--datos', default='.', help='Directorio con docentes_v3.csv y materias.csv')
+parser.add_argument('--artefactos', help="Pickle con {'modelo', 'scaler'}")
+parser.add_argument('--salida', required=True, help='Directorio compartido de resultados')
+parser.add_argument('--ejecucion', required=True, help='Identificador de la ejecución (igual en todos los nodos)')
+parser.add_argument('--nodo', type=int, default=0)
+parser.add_argument('--total-nodos', type=int, default=1)
+parser.add_argument('--procesos', type=int, default=None)
+parser.add_argument('--top-n', type=int, default=10)
+parser.add_argument('--materias-por-shard', type=int, default=MATERIAS_POR_SHARD,
+                    help='Máximo de materias por shard (igual en todos los nodos)')
+parser.add_argument('--combinar', action='store_true', help='Solo combinar los shards ya escritos')
+args = parser.parse_args()
+
+print("=" * 70)
+if args.combinar:
+    print("🔗 COMBINANDO RESULTADOS DE SHARDS")
+    print("=" * 70)
+    resultado = combinar_directorio(args.salida, args.ejecucion)
+    ruta = os.path.join(args.salida, f'{args.ejecucion}_carga_docentes.csv')
+    resultado['carga_docentes'].to_csv(ruta, index=False, encoding='utf-8')
+    print(f"\n✅ {resultado['ranking']['carrera'].nunique()} carreras, "
+          f"{len(resultado['ranking']):,} filas de ranking")
+    print(f"✅ Carga combinada de {len(resultado['carga_docentes'])} docentes en {ruta}")
+else:
+    if not args.artefactos:
+        parser.error('--artefactos es obligatorio salvo con --combinar')
+    print(f"🧩 NODO {args.nodo + 1}/{args.total_nodos}")
+    print("=" * 70)
+    df_docentes, df_materias, _ = cargar_datasets(args.datos)
+    inicio = time.perf_counter()
+    rutas = ejecutar_nodo(df_docentes, df_materias, args.artefactos, args.salida,
+                          args.nodo, args.total_nodos, args.ejecucion, top_n=args.top_n,
+                          max_procesos=args.procesos, max_materias_por_shard=args.materias_por_shard)
+    print(f"\n✅ {len(rutas)} shards procesados en {time.perf_counter() - inicio:.2f} s")
+    for ruta in rutas:
+        print(f"   - {ruta}")
@@ -0,0 +1,165 @@
+"""
+Actualización incremental de modelos con los resultados de un nuevo periodo
+
+En lugar de repetir SMOTE + split + RandomForest + Grid Search completo cada
+vez que llega un `periodo_academico`, continúa desde el modelo guardado:
+- XGBoost: rondas de boosting adicionales sobre el booster existente.
+- RandomForest: `warm_start` con árboles adicionales.
+
+Los árboles nuevos se entrenan solo con las filas del periodo nuevo. Si la
+calidad en el holdout cae más de `tolerancia`, se recurre al reentrenamiento
+completo. En el modo incremental el scaler se mantiene fijo (solo
+`transform`) para que el espacio de features coincida con el de los árboles
+ya entrenados; el reentrenamiento completo devuelve su propio scaler.
+
+Los resultados de un periodo (id_docente, id_materia, periodo_academico,
+efectividad_asignacion) no traen las features del modelo: se unen a los
+pares de `construir_asignaciones` con `unir_resultados_periodo`.
+`data/raw/dataset_asignaciones.csv` tiene el esquema anterior (materias de
+`data/raw/asignaturas.csv`, certificaciones y proyectos agregados), así que
+no sirve directamente: faltan total_certificaciones y los proyectos por tipo.
+"""
+
+import copy
+import time
+
+import numpy as np
+from sklearn.metrics import f1_score
+from sklearn.model_selection import train_test_split
+
+from .config import FEATURE_COLS
+from .data_loader import construir_asignaciones
+
+COLUMNAS_RESULTADO = ['id_docente', 'id_materia', 'periodo_academico', 'efectividad_asignacion']
+
+
+def filas_de_periodo(df_asignaciones, periodo, columna='periodo_academico'):
+    """Filas de uno o varios periodos académicos"""
+    periodos = [periodo] if isinstance(periodo, str) else list(periodo)
+    return df_asignaciones[df_asignaciones[columna].isin(periodos)]
+
+
+def unir_resultados_periodo(df_resultados, df_docentes, df_materias):
+    """
+    Features de `construir_asignaciones(df_docentes, df_materias)` para cada
+    resultado observado. `df_resultados` necesita COLUMNAS_RESULTADO (puede
+    repetir un par: varios paralelos o periodos); su `efectividad_asignacion`
+    reemplaza a la derivada de la idoneidad y el resto de sus columnas se
+    conserva. Lanza ValueError si algún par no está en los catálogos.
+    """
+    faltantes = [col for col in COLUMNAS_RESULTADO if col not in df_resultados.columns]
+    if faltantes:
+        raise ValueError(f"Los resultados no tienen las columnas {faltantes}")
+
+    pares = construir_asignaciones(df_docentes, df_materias).drop(columns='efectividad_asignacion')
+    columnas_resultado = [col for col in df_resultados.columns if col not in pares.columns or col in COLUMNAS_RESULTADO]
+    unido = df_resultados[columnas_resultado].merge(
+        pares, on=['id_docente', 'id_materia'], how='left', validate='many_to_one', indicator=True
+    )
+    sin_par = unido['_merge'] == 'left_only'
+    if sin_par.any():
+        ejemplos = unido.loc[sin_par, ['id_docente', 'id_materia']].drop_duplicates().head(5)
+        raise ValueError(
+            f"{int(sin_par.sum())} resultados sin par en los catálogos de docentes/materias: "
+            f"{list(ejemplos.itertuples(index=False, name=None))}"
+        )
+    return unido.drop(columns='_merge').set_index(df_resultados.index)
+
+
+def _f1(modelo, X, y):
+    return f1_score(y, modelo.predict(X), average='weighted', zero_division=0)
+
+
+def _continuar_entrenamiento(modelo, X, y, rondas_extra, arboles_extra):
+    """Copia del modelo con rondas/árboles adicionales entrenados sobre (X, y)"""
+    nuevo = copy.deepcopy(modelo)
+    if hasattr(modelo, 'get_booster'):
+        nuevo.set_params(n_estimators=rondas_extra)
+        nuevo.fit(X, y, xgb_model=modelo.get_booster())
+        # get_params()/clone() deben describir el total real de rondas
+        nuevo.set_params(n_estimators=nuevo.get_booster().num_boosted_rounds())
+    elif hasattr(modelo, 'estimators_'):
+        nuevo.set_params(warm_start=True, n_estimators=len(modelo.estimators_) + arboles_extra)
+        nuevo.fit(X, y)
+        nuevo.set_params(warm_start=False)
+    else:
+        raise TypeError(f"Modelo no soportado para actualización incremental: {type(modelo).__name__}")
+    return nuevo
+
+
+def actualizar_modelo(modelo, scaler, X_nuevo, y_nuevo, X_holdout, y_holdout, reentrenar_completo,
+                      rondas_extra=50, arboles_extra=20, tolerancia=0.01, feature_cols=FEATURE_COLS):
+    """
+    Actualiza `modelo` con las filas nuevas y valida contra el holdout.
+
+    `X_nuevo` y `X_holdout` llegan sin escalar (DataFrames). Si hace falta
+    reentrenar desde cero se llama `reentrenar_completo(indices_holdout)`, que
+    debe ejecutar el pipeline completo del notebook (SMOTE, split, scaler,
+    modelo) SIN las filas de `indices_holdout` y devolver `(modelo, scaler)`;
+    el F1 final se mide sobre el holdout escalado con ese nuevo scaler.
+    Devuelve (modelo, scaler, reporte).
+    """
+    inicio = time.perf_counter()
+    holdout_sin_escalar = X_holdout[feature_cols]
+    X_nuevo = scaler.transform(X_nuevo[feature_cols])
+    X_holdout = scaler.transform(holdout_sin_escalar)
+    y_nuevo = np.asarray(y_nuevo)
+    y_holdout = np.asarray(y_holdout)
+
+    f1_antes = _f1(modelo, X_holdout, y_holdout)
+    reporte = {
+        'filas_nuevas': len(y_nuevo),
+        'f1_antes': f1_antes,
+        'f1_incremental': None,
+        'f1_despues': None,
+        'modo': 'incremental',
+        'motivo': None
+    }
+
+    clases_faltantes = set(modelo.classes_) - set(np.unique(y_nuevo))
+    if clases_faltantes:
+        reporte['motivo'] = f"El periodo nuevo no contiene las clases {sorted(clases_faltantes)}"
+    else:
+        actualizado = _continuar_entrenamiento(modelo, X_nuevo, y_nuevo, rondas_extra, arboles_extra)
+        reporte['f1_incremental'] = reporte['f1_despues'] = _f1(actualizado, X_holdout, y_holdout)
+        if reporte['f1_incremental'] < f1_antes - tolerancia:
+            reporte['motivo'] = (
+                f"F1 en holdout bajó de {f1_antes:.4f} a {reporte['f1_incremental']:.4f} "
+                f"(tolerancia {tolerancia})"
+            )
+
+    if reporte['motivo'] is not None:
+        actualizado, scaler = reentrenar_completo(holdout_sin_escalar.index)
+        reporte['modo'] = 'completo'
+        reporte['f1_despues'] = _f1(actualizado, scaler.transform(holdout_sin_escalar), y_holdout)
+
+    reporte['segundos'] = time.perf_counter() - inicio
+    return actualizado, scaler, reporte
+
+
+def actualizar_desde_periodo(modelo, scaler, df_asignaciones, periodo, reentrenar_completo,
+                             fraccion_holdout=0.2, columna_objetivo='efectividad_asignacion',
+                             random_state=42, **kwargs):
+    """
+    Separa un holdout estratificado del periodo nuevo y llama a `actualizar_modelo`.
+
+    `df_asignaciones` necesita `periodo_academico`, el objetivo y las
+    `feature_cols` (p. ej. la salida de `unir_resultados_periodo`). Los índices
+    que recibe `reentrenar_completo` son etiquetas de `df_asignaciones`.
+    """
+    columnas = kwargs.get('feature_cols', FEATURE_COLS)
+    faltantes = [col for col in columnas if col not in df_asignaciones.columns]
+    if faltantes:
+        raise ValueError(f"Faltan las features {faltantes}; una los resultados con unir_resultados_periodo()")
+    df_periodo = filas_de_periodo(df_asignaciones, periodo)
+    y = df_periodo[columna_objetivo]
+    estratos = y if y.value_counts().min() >= 2 else None
+    df_nuevo, df_holdout = train_test_split(
+        df_periodo, test_size=fraccion_holdout, random_state=random_state, stratify=estratos
+    )
+    return actualizar_modelo(
+        modelo, scaler,
+        df_nuevo, df_nuevo[columna_objetivo],
+        df_holdout, df_holdout[columna_objetivo],
+        reentrenar_completo, **kwargs
+    )
@@ -0,0 +1,74 @@
+"""
+Configuración compartida del sistema de recomendación docente
+"""
+
+# ============================================
+# ÁREAS DE CONOCIMIENTO
+# ============================================
+AREAS = [
+    'Programación',
+    'Base de Datos',
+    'Matemáticas',
+    'Software',
+    'Gestión Computacional',
+    'Administración',
+    'Computación'
+]
+
+AREA_TO_KEY = {
+    'Programación': 'programacion',
+    'Base de Datos': 'bases_datos',
+    'Matemáticas': 'matematicas',
+    'Software': 'software',
+    'Gestión Computacional': 'gestion_compu',
+    'Administración': 'administracion',
+    'Computación': 'computacion'
+}
+
+# ============================================
+# SIMILITUD ENTRE DOCENTES (REEMPLAZOS)
+# ============================================
+COLUMNAS_EXPERIENCIA = [
+    'tiene_maestria',
+    'tiene_doctorado',
+    'anios_experiencia_docente_total',
+    'anios_experiencia_industria',
+    'total_certificaciones'
+]
+
+COLUMNAS_SIMILITUD = (
+    [f'comp_{key}' for key in AREA_TO_KEY.values()] +
+    [f'score_herramientas_{key}' for key in AREA_TO_KEY.values()] +
+    [f'score_enfoque_{key}' for key in AREA_TO_KEY.values()] +
+    [f'idoneidad_{key}' for key in AREA_TO_KEY.values()] +
+    COLUMNAS_EXPERIENCIA
+)
+
+# ============================================
+# UMBRALES DE EFECTIVIDAD (IDONEIDAD %)
+# ============================================
+UMBRAL_ALTA = 71
+UMBRAL_MEDIA = 51
+
+CLASES_EFECTIVIDAD = {0: 'Baja', 1: 'Media', 2: 'Alta'}
+
+# ============================================
+# FEATURES DEL MODELO (FASE 4)
+# ============================================
+FEATURE_COLS = [
+    'tiene_maestria', 'tiene_doctorado',
+    'anios_exp_docente', 'anios_exp_industria',
+    'comp_programacion', 'comp_bases_datos', 'comp_software',
+    'comp_matematicas', 'comp_gestion_compu', 'comp_administracion', 'comp_computacion',
+    'total_certificaciones',
+    'proyectos_desarrollo_reales', 'proyectos_software_reales', 'proyectos_bd_reales',
+    'experiencia_total', 'ratio_cert_exp', 'promedio_comp_tecnicas',
+    'match_area', 'semestre', 'creditos', 'nivel_complejidad'
+]
+
+CLASE_ALTA = 2
+
+# ============================================
+# CARRERAS (SHARDING)
+# ============================================
+CARRERA_POR_DEFECTO = 'Carrera de Software'
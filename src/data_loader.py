@@ -0,0 +1,69 @@
+"""
+Carga de datasets y construcción del dataset de asignaciones (FASE 1 y 3)
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .config import AREA_TO_KEY, UMBRAL_ALTA, UMBRAL_MEDIA
+
+NIVEL_COMPLEJIDAD = {'Alto': 2, 'Medio': 1, 'Bajo': 0}
+
+
+def cargar_datasets(directorio='.', archivo_docentes='docentes_v3.csv'):
+    """Carga docentes, materias y perfiles ideales desde `directorio`"""
+    df_docentes = pd.read_csv(os.path.join(directorio, archivo_docentes), encoding='utf-8')
+    df_materias = pd.read_csv(os.path.join(directorio, 'materias.csv'), encoding='utf-8')
+    df_perfiles_ideales = pd.read_csv(os.path.join(directorio, 'perfiles_ideales.csv'), encoding='utf-8')
+
+    # Normalizar código de materias
+    df_materias['codigo'] = df_materias['codigo'].astype(str).str.strip()
+    return df_docentes, df_materias, df_perfiles_ideales
+
+
+def construir_asignaciones(df_docentes, df_materias):
+    """
+    Producto docentes × materias con las mismas columnas que FASE 3 del notebook,
+    construido con un merge en lugar de dos `iterrows` anidados.
+    """
+    docentes = df_docentes.rename(columns={
+        'area_principal': 'area_docente',
+        'anios_experiencia_docente_total': 'anios_exp_docente',
+        'anios_experiencia_industria': 'anios_exp_industria'
+    })
+    materias = df_materias[['id_materia', 'area_conocimiento', 'semestre', 'creditos', 'nivel_complejidad']]
+    materias = materias.rename(columns={'area_conocimiento': 'area_materia'})
+
+    columnas_docente = [
+        'id_docente', 'area_docente', 'tiene_maestria', 'tiene_doctorado',
+        'anios_exp_docente', 'anios_exp_industria',
+        'comp_programacion', 'comp_bases_datos', 'comp_software', 'comp_matematicas',
+        'comp_gestion_compu', 'comp_administracion', 'comp_computacion',
+        'total_certificaciones',
+        'proyectos_desarrollo_reales', 'proyectos_software_reales', 'proyectos_bd_reales',
+        'experiencia_total', 'ratio_cert_exp', 'promedio_comp_tecnicas'
+    ]
+    df = docentes[columnas_docente].merge(materias, how='cross')
+
+    # Idoneidad del docente en el área de la materia (Programación por defecto)
+    columnas_idoneidad = [f'idoneidad_{key}' for key in AREA_TO_KEY.values()]
+    matriz_idoneidad = df_docentes[columnas_idoneidad].to_numpy()
+    posicion_area = {area: j for j, area in enumerate(AREA_TO_KEY)}
+    indice_area = df['area_materia'].map(posicion_area).fillna(0).astype(int).to_numpy()
+    indice_docente = np.repeat(np.arange(len(df_docentes)), len(df_materias))
+    df['score_idoneidad'] = matriz_idoneidad[indice_docente, indice_area]
+
+    df['match_area'] = (df['area_docente'] == df['area_materia']).astype(int)
+    df['nivel_complejidad'] = df['nivel_complejidad'].map(NIVEL_COMPLEJIDAD).fillna(0).astype(int)
+    df['efectividad_asignacion'] = np.select(
+        [df['score_idoneidad'] >= UMBRAL_ALTA, df['score_idoneidad'] >= UMBRAL_MEDIA], [2, 1], default=0
+    )
+
+    orden = [
+        'id_docente', 'id_materia', 'area_materia', 'area_docente', 'match_area',
+        *columnas_docente[2:],
+        'semestre', 'creditos', 'nivel_complejidad', 'score_idoneidad', 'efectividad_asignacion'
+    ]
+    return df[orden]
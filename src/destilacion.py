@@ -0,0 +1,150 @@
+"""
+Destilación del modelo de ranking a modelos ligeros para servir
+
+Para el ranking solo importa el orden de `prob_alta`, así que un modelo
+"estudiante" compacto (GBM poco profundo, árbol, bosque pequeño o lineal)
+se entrena como regresor sobre la `prob_alta` del modelo "maestro" (XGBoost
+ajustado). Una parte de los docentes se reserva (partición por id_docente)
+para medir la fidelidad fuera de muestra: el reporte compara por materia la
+correlación de rangos (Spearman) y el solapamiento del top-K en docentes no
+vistos, junto a las mismas métricas en entrenamiento y la aceleración en
+predicción.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import GroupShuffleSplit
+from sklearn.tree import DecisionTreeRegressor
+
+from .config import CLASE_ALTA, FEATURE_COLS
+
+ESTUDIANTES_POR_DEFECTO = {
+    'gbm_poco_profundo': HistGradientBoostingRegressor(max_depth=3, max_iter=100, random_state=42),
+    'arbol_decision': DecisionTreeRegressor(max_depth=8, min_samples_leaf=5, random_state=42),
+    'bosque_pequeno': RandomForestRegressor(n_estimators=10, max_depth=8, min_samples_leaf=5,
+                                            random_state=42, n_jobs=1),
+    'lineal': Ridge(alpha=1.0)
+}
+
+
+def _tiempo_prediccion(predecir, X, repeticiones):
+    """Mejor tiempo de `repeticiones` llamadas a predecir(X)"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        predecir(X)
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+def fidelidad_por_materia(ids_materia, prob_maestro, prob_estudiante, top_k=10):
+    """
+    Spearman y solapamiento del top-K entre maestro y estudiante, por materia.
+
+    Si ambos rankings son constantes el Spearman es 1.0; si solo uno lo es no
+    está definido y queda en NaN (las medias lo excluyen).
+    """
+    df = pd.DataFrame({
+        'id_materia': np.asarray(ids_materia),
+        'maestro': prob_maestro,
+        'estudiante': prob_estudiante
+    })
+    grupos = df.groupby('id_materia', sort=False)
+    df['rango_maestro'] = grupos['maestro'].rank()
+    df['rango_estudiante'] = grupos['estudiante'].rank()
+
+    filas = []
+    for id_materia, grupo in df.groupby('id_materia', sort=False):
+        k = min(top_k, len(grupo))
+        top_maestro = set(grupo.nlargest(k, 'maestro').index)
+        top_estudiante = set(grupo.nlargest(k, 'estudiante').index)
+        constantes = grupo['maestro'].nunique() <= 1, grupo['estudiante'].nunique() <= 1
+        if all(constantes):
+            spearman = 1.0
+        elif any(constantes):
+            spearman = np.nan
+        else:
+            spearman = grupo['rango_maestro'].corr(grupo['rango_estudiante'])
+        filas.append({
+            'id_materia': id_materia,
+            'spearman': spearman,
+            'solapamiento_top_k': len(top_maestro & top_estudiante) / k
+        })
+    return pd.DataFrame(filas)
+
+
+def destilar_modelo(maestro, scaler, df_asignaciones, estudiantes=None, top_k=10,
+                    feature_cols=FEATURE_COLS, repeticiones_tiempo=3,
+                    proporcion_validacion=0.3, semilla=42):
+    """
+    Entrena cada estudiante sobre la `prob_alta` del maestro.
+
+    Los pares de una fracción `proporcion_validacion` de docentes (partición
+    por id_docente) quedan fuera del entrenamiento y miden la fidelidad en
+    docentes no vistos; el top-K de validación se calcula entre esos docentes,
+    así que conviene que sean más que `top_k`. Los estudiantes devueltos se
+    reentrenan después con todos los pares.
+
+    Devuelve un dict con:
+    - 'reporte': una fila por estudiante (Spearman y top-K medio/mínimo y
+      error absoluto medio en validación, medias de entrenamiento, tiempo de
+      predicción y aceleración vs maestro)
+    - 'detalle': fidelidad por estudiante, conjunto y materia
+    - 'estudiantes': los modelos entrenados con todos los pares
+    """
+    estudiantes = estudiantes if estudiantes is not None else ESTUDIANTES_POR_DEFECTO
+    X = scaler.transform(df_asignaciones[feature_cols])
+    ids_materia = df_asignaciones['id_materia'].to_numpy()
+
+    prob_maestro = maestro.predict_proba(X)[:, CLASE_ALTA]
+    tiempo_maestro = _tiempo_prediccion(maestro.predict_proba, X, repeticiones_tiempo)
+
+    particion = GroupShuffleSplit(n_splits=1, test_size=proporcion_validacion, random_state=semilla)
+    entrenamiento, validacion = next(particion.split(X, groups=df_asignaciones['id_docente']))
+
+    entrenados = {}
+    reporte = []
+    detalle = []
+    for nombre, estimador in estudiantes.items():
+        estudiante = clone(estimador).fit(X[entrenamiento], prob_maestro[entrenamiento])
+        prob_estudiante = estudiante.predict(X)
+
+        fidelidad = {}
+        for conjunto, filas in (('entrenamiento', entrenamiento), ('validacion', validacion)):
+            fidelidad[conjunto] = fidelidad_por_materia(ids_materia[filas], prob_maestro[filas],
+                                                        prob_estudiante[filas], top_k=top_k)
+            fidelidad[conjunto].insert(0, 'conjunto', conjunto)
+            fidelidad[conjunto].insert(0, 'estudiante', nombre)
+            detalle.append(fidelidad[conjunto])
+
+        estudiante = clone(estimador).fit(X, prob_maestro)
+        tiempo_estudiante = _tiempo_prediccion(estudiante.predict, X, repeticiones_tiempo)
+        entrenados[nombre] = estudiante
+
+        validado = fidelidad['validacion']
+        reporte.append({
+            'estudiante': nombre,
+            'spearman_medio': validado['spearman'].mean(),
+            'spearman_min': validado['spearman'].min(),
+            f'top_{top_k}_medio': validado['solapamiento_top_k'].mean(),
+            f'top_{top_k}_min': validado['solapamiento_top_k'].min(),
+            'error_abs_medio': np.abs(prob_estudiante[validacion] - prob_maestro[validacion]).mean(),
+            'spearman_medio_entrenamiento': fidelidad['entrenamiento']['spearman'].mean(),
+            f'top_{top_k}_medio_entrenamiento': fidelidad['entrenamiento']['solapamiento_top_k'].mean(),
+            'segundos_prediccion': tiempo_estudiante,
+            'aceleracion': tiempo_maestro / tiempo_estudiante if tiempo_estudiante > 0 else np.inf
+        })
+
+    reporte = pd.DataFrame(reporte).sort_values('spearman_medio', ascending=False).reset_index(drop=True)
+    reporte.attrs['segundos_prediccion_maestro'] = tiempo_maestro
+
+    return {
+        'reporte': reporte,
+        'detalle': pd.concat(detalle, ignore_index=True),
+        'estudiantes': entrenados
+    }
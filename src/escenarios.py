@@ -0,0 +1,201 @@
+"""
+Motor de escenarios "what-if" sobre las ponderaciones de idoneidad
+
+Evalúa cientos de variantes de `PONDERACIONES` / `perfiles_ideales.csv` en
+una sola operación tensorial (escenarios × docentes × áreas) y resume, por
+escenario, la distribución Alta/Media/Baja y los cambios del top-K por área
+respecto al escenario base.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import AREAS, AREA_TO_KEY, UMBRAL_ALTA, UMBRAL_MEDIA
+
+# ============================================
+# NORMALIZACIÓN (igual que calcular_idoneidad)
+# ============================================
+# variable: (divisor, recortar_a_1, valor_por_defecto)
+NORMALIZACION_IDONEIDAD = {
+    'tiene_maestria': (1, False, 0),
+    'tiene_doctorado': (1, False, 0),
+    'anios_experiencia_docente_total': (20, True, 0),
+    'anios_experiencia_industria': (20, True, 0),
+    'comp_programacion': (5, False, 0),
+    'comp_bases_datos': (5, False, 0),
+    'comp_software': (5, False, 0),
+    'comp_matematicas': (5, False, 0),
+    'comp_gestion_compu': (5, False, 0),
+    'comp_administracion': (5, False, 0),
+    'comp_computacion': (5, False, 0),
+    'total_certificaciones': (15, True, 0),
+    'proyectos_desarrollo_reales': (5, False, 0),
+    'proyectos_software_reales': (5, False, 0),
+    'proyectos_bd_reales': (5, False, 0),
+    'proyectos_matematicos_reales': (5, False, 0),
+    'proyectos_infraestructura_reales': (5, False, 0),
+    'produccion_academica': (5, False, 0),
+    'comp_pedagogica_comunicacion': (5, False, 3),
+    'comp_tec_herramientas_colaborativas': (5, False, 3),
+    'experiencia_total': (35, True, 0),
+    'ratio_cert_exp': (1.5, True, 0),
+    'veces_impartio_area': (15, True, 0),
+    'prefiere_area': (1, False, 0)
+}
+
+# Variables cuyo valor depende del área evaluada
+VARIABLES_POR_AREA = ['veces_impartio_area', 'prefiere_area']
+
+VARIABLES = list(NORMALIZACION_IDONEIDAD)
+
+
+def ponderaciones_desde_perfiles(df_perfiles):
+    """Convierte `perfiles_ideales.csv` al formato {área: {variable: peso}}"""
+    ponderaciones = {}
+    for _, perfil in df_perfiles.iterrows():
+        pesos = {}
+        for col, peso in perfil.items():
+            if col.startswith('peso_') and pd.notna(peso):
+                pesos[col[len('peso_'):]] = float(peso)
+        ponderaciones[perfil['area_conocimiento']] = pesos
+    return ponderaciones
+
+
+def apilar_ponderaciones(lista_ponderaciones, areas=AREAS):
+    """Apila varios dicts {área: {variable: peso}} en un tensor (S, A, V)"""
+    pesos = np.zeros((len(lista_ponderaciones), len(areas), len(VARIABLES)))
+    posicion_variable = {var: j for j, var in enumerate(VARIABLES)}
+
+    for s, ponderaciones in enumerate(lista_ponderaciones):
+        for a, area in enumerate(areas):
+            for variable, peso in ponderaciones.get(area, {}).items():
+                if variable not in posicion_variable:
+                    raise ValueError(f"Variable de ponderación desconocida: '{variable}'")
+                pesos[s, a, posicion_variable[variable]] = peso
+    return pesos
+
+
+class MotorEscenarios:
+    """Calcula idoneidad para docentes × áreas × escenarios en bloque"""
+
+    def __init__(self, df_docentes, areas=AREAS):
+        self.areas = list(areas)
+        self.ids = df_docentes['id_docente'].to_numpy()
+        self.variables_comunes = [v for v in VARIABLES if v not in VARIABLES_POR_AREA]
+        self.indices_comunes = [VARIABLES.index(v) for v in self.variables_comunes]
+        self.indices_por_area = [VARIABLES.index(v) for v in VARIABLES_POR_AREA]
+
+        # Matriz (N, V_comunes) normalizada igual que calcular_idoneidad
+        columnas = []
+        for variable in self.variables_comunes:
+            divisor, recortar, defecto = NORMALIZACION_IDONEIDAD[variable]
+            if variable in df_docentes.columns:
+                valores = df_docentes[variable].fillna(defecto).to_numpy(dtype=np.float64)
+            else:
+                valores = np.full(len(df_docentes), float(defecto))
+            valores = valores / divisor
+            columnas.append(np.minimum(1.0, valores) if recortar else valores)
+        self.X_comun = np.column_stack(columnas)
+
+        # Tensor (N, A, 2) para veces_impartio_area y prefiere_area. El generador
+        # sortea veces_impartio (0-2) fuera del área principal y no lo guarda,
+        # por eso aquí se toma 0 para esas áreas.
+        area_principal = df_docentes['area_principal'].to_numpy()
+        veces = df_docentes.get('veces_impartio_area', pd.Series(0, index=df_docentes.index))
+        veces = np.minimum(1.0, veces.fillna(0).to_numpy(dtype=np.float64) / 15)
+        self.X_area = np.zeros((len(df_docentes), len(self.areas), len(VARIABLES_POR_AREA)))
+        for a, area in enumerate(self.areas):
+            es_principal = area_principal == area
+            self.X_area[:, a, 0] = np.where(es_principal, veces, 0.0)
+            col_prefiere = f'prefiere_{AREA_TO_KEY[area]}'
+            if col_prefiere in df_docentes.columns:
+                self.X_area[:, a, 1] = df_docentes[col_prefiere].fillna(0).to_numpy(dtype=np.float64)
+            else:
+                self.X_area[:, a, 1] = es_principal
+
+    def idoneidad(self, pesos):
+        """Idoneidad (S, N, A) en % para un tensor de pesos (S, A, V)"""
+        pesos = np.asarray(pesos, dtype=np.float64)
+        if pesos.ndim == 2:
+            pesos = pesos[np.newaxis]
+        scores = np.einsum('nv,sav->sna', self.X_comun, pesos[:, :, self.indices_comunes], optimize=True)
+        scores += np.einsum('nav,sav->sna', self.X_area, pesos[:, :, self.indices_por_area], optimize=True)
+        return scores * 100
+
+    def evaluar(self, pesos, pesos_base, nombres=None, top_k=10, tamano_bloque=64):
+        """
+        Evalúa un tensor de escenarios (S, A, V) contra el escenario base (A, V).
+
+        Devuelve un dict con:
+        - 'distribuciones': conteo Alta/Media/Baja (docente × área) por escenario
+        - 'cambios_ranking': por escenario y área, solapamiento del top-K con el
+          base, docentes que entran y cambio medio de posición del top-K base
+        Los escenarios se procesan en bloques de `tamano_bloque` para acotar memoria.
+        """
+        pesos = np.asarray(pesos, dtype=np.float64)
+        num_escenarios = pesos.shape[0]
+        nombres = list(nombres) if nombres is not None else [f'escenario_{s + 1}' for s in range(num_escenarios)]
+        top_k = min(top_k, len(self.ids))
+
+        base = self.idoneidad(pesos_base)[0]                              # (N, A)
+        top_base = np.argpartition(-base, top_k - 1, axis=0)[:top_k]     # (K, A)
+        num_docentes = len(self.ids)
+        ordenado_base = np.sort(base, axis=0)
+        rango_base = np.stack([
+            num_docentes - np.searchsorted(ordenado_base[:, a], base[top_base[:, a], a], side='right')
+            for a in range(len(self.areas))
+        ], axis=1)                                                        # (K, A)
+
+        distribuciones = []
+        cambios = []
+        for inicio in range(0, num_escenarios, tamano_bloque):
+            bloque = self.idoneidad(pesos[inicio:inicio + tamano_bloque])  # (B, N, A)
+
+            alta = (bloque >= UMBRAL_ALTA).sum(axis=(1, 2))
+            media = ((bloque >= UMBRAL_MEDIA) & (bloque < UMBRAL_ALTA)).sum(axis=(1, 2))
+            baja = (bloque < UMBRAL_MEDIA).sum(axis=(1, 2))
+
+            top_bloque = np.argpartition(-bloque, top_k - 1, axis=1)[:, :top_k]  # (B, K, A)
+
+            # Posición de cada docente del top-K base en el escenario: número de
+            # docentes con score estrictamente mayor, vía orden por área + searchsorted
+            scores_top_base = np.take_along_axis(bloque, top_base[np.newaxis], axis=1)        # (B, K, A)
+            ordenado = np.sort(bloque, axis=1)                                                # (B, N, A)
+            rango_escenario = np.empty(scores_top_base.shape, dtype=np.int64)
+            for b in range(bloque.shape[0]):
+                for a in range(len(self.areas)):
+                    rango_escenario[b, :, a] = num_docentes - np.searchsorted(
+                        ordenado[b, :, a], scores_top_base[b, :, a], side='right'
+                    )
+            cambio_medio = np.abs(rango_escenario - rango_base[np.newaxis]).mean(axis=1)       # (B, A)
+
+            for b in range(bloque.shape[0]):
+                nombre = nombres[inicio + b]
+                distribuciones.append({
+                    'escenario': nombre,
+                    'Alta': int(alta[b]),
+                    'Media': int(media[b]),
+                    'Baja': int(baja[b])
+                })
+                for a, area in enumerate(self.areas):
+                    comunes = np.intersect1d(top_bloque[b, :, a], top_base[:, a]).size
+                    cambios.append({
+                        'escenario': nombre,
+                        'area': area,
+                        'solapamiento_top_k': comunes / top_k,
+                        'docentes_nuevos_top_k': top_k - comunes,
+                        'cambio_medio_posicion': round(float(cambio_medio[b, a]), 2)
+                    })
+
+        df_distribuciones = pd.DataFrame(distribuciones)
+        base_alta = int((base >= UMBRAL_ALTA).sum())
+        base_media = int(((base >= UMBRAL_MEDIA) & (base < UMBRAL_ALTA)).sum())
+        base_baja = int((base < UMBRAL_MEDIA).sum())
+        df_distribuciones['delta_Alta'] = df_distribuciones['Alta'] - base_alta
+        df_distribuciones['delta_Media'] = df_distribuciones['Media'] - base_media
+        df_distribuciones['delta_Baja'] = df_distribuciones['Baja'] - base_baja
+
+        return {
+            'distribuciones': df_distribuciones,
+            'cambios_ranking': pd.DataFrame(cambios)
+        }
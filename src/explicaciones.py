@@ -0,0 +1,148 @@
+"""
+Explicaciones por recomendación (contribución de cada feature)
+
+Complementa la importancia global de FASE 8 con la contribución de cada
+feature a `prob_alta` para un par docente × materia concreto:
+- RandomForest: descomposición por caminos del árbol (bias + Σ contribuciones
+  = probabilidad predicha).
+- XGBoost: TreeSHAP nativo (`pred_contribs=True`), en escala de margen (log-odds).
+
+Solo se explican las filas del top-K de un ranking y los resultados se
+guardan en caché por versión del modelo, par docente × materia y huella de
+la fila escalada: si se recargan datos con el mismo modelo (p. ej. un
+`docentes_v3.csv` regenerado), las filas cambiadas se vuelven a explicar.
+"""
+
+import hashlib
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from .config import CLASE_ALTA, FEATURE_COLS
+
+
+def version_de_modelo(modelo):
+    """Huella del modelo serializado, útil como identificador de versión"""
+    return hashlib.sha1(pickle.dumps(modelo)).hexdigest()[:12]
+
+
+class ExplicadorRecomendaciones:
+    """Contribuciones por feature para pares docente × materia, con caché"""
+
+    def __init__(self, modelo, scaler, feature_cols=FEATURE_COLS, version=None, clase=CLASE_ALTA):
+        self.modelo = modelo
+        self.scaler = scaler
+        self.feature_cols = list(feature_cols)
+        self.version = version or version_de_modelo(modelo)
+        self.clase = clase
+        self._cache = {}
+        self._tablas_arboles = None
+
+        if hasattr(modelo, 'get_booster'):
+            self.tipo = 'xgboost'
+        elif hasattr(modelo, 'estimators_'):
+            self.tipo = 'random_forest'
+        else:
+            raise TypeError(f"Modelo no soportado para explicaciones: {type(modelo).__name__}")
+
+    # ============================================
+    # RANDOM FOREST: contribuciones por camino
+    # ============================================
+    def _preparar_arboles(self):
+        """Por árbol: matriz (nodos × features) con el cambio de probabilidad en cada arista"""
+        tablas = []
+        for arbol in self.modelo.estimators_:
+            tree = arbol.tree_
+            valores = tree.value[:, 0, :]
+            valores = valores / valores.sum(axis=1, keepdims=True)
+            prob_clase = valores[:, self.clase]
+
+            contribucion_nodo = np.zeros((tree.node_count, len(self.feature_cols)))
+            padres = np.flatnonzero(tree.children_left != -1)
+            for hijos in (tree.children_left[padres], tree.children_right[padres]):
+                contribucion_nodo[hijos, tree.feature[padres]] = prob_clase[hijos] - prob_clase[padres]
+            tablas.append((prob_clase[0], contribucion_nodo))
+        return tablas
+
+    def _contribuciones_random_forest(self, X):
+        if self._tablas_arboles is None:
+            self._tablas_arboles = self._preparar_arboles()
+
+        X = np.asarray(X, dtype=np.float32)
+        contribuciones = np.zeros((len(X), len(self.feature_cols)))
+        base = 0.0
+        for arbol, (bias, contribucion_nodo) in zip(self.modelo.estimators_, self._tablas_arboles):
+            camino = arbol.decision_path(X)
+            contribuciones += camino @ contribucion_nodo
+            base += bias
+        num_arboles = len(self.modelo.estimators_)
+        return contribuciones / num_arboles, np.full(len(X), base / num_arboles)
+
+    # ============================================
+    # XGBOOST: TreeSHAP nativo
+    # ============================================
+    def _contribuciones_xgboost(self, X):
+        from xgboost import DMatrix
+
+        shap = self.modelo.get_booster().predict(DMatrix(X), pred_contribs=True, strict_shape=True)
+        # strict_shape: (filas, clases, features + 1); la última columna es el bias
+        return shap[:, self.clase, :-1], shap[:, self.clase, -1]
+
+    # ============================================
+    # API
+    # ============================================
+    def explicar(self, filas):
+        """
+        Explica las filas de `df_asignaciones` recibidas (sin escalar).
+
+        Devuelve un DataFrame indexado por (id_docente, id_materia) con una
+        columna por feature, más `base` y `prediccion` (= base + Σ contribuciones).
+        """
+        pares = list(zip(filas['id_docente'], filas['id_materia']))
+        X_filas = np.ascontiguousarray(self.scaler.transform(filas[self.feature_cols]), dtype=np.float64)
+        claves = [
+            (self.version, par, hashlib.blake2b(fila.tobytes(), digest_size=8).hexdigest())
+            for par, fila in zip(pares, X_filas)
+        ]
+        pendientes = [i for i, clave in enumerate(claves) if clave not in self._cache]
+
+        if pendientes:
+            X = X_filas[pendientes]
+            if self.tipo == 'random_forest':
+                contribuciones, base = self._contribuciones_random_forest(X)
+            else:
+                contribuciones, base = self._contribuciones_xgboost(X)
+            for j, i in enumerate(pendientes):
+                self._cache[claves[i]] = (contribuciones[j], base[j])
+
+        resultado = pd.DataFrame(
+            [self._cache[clave][0] for clave in claves],
+            columns=self.feature_cols,
+            index=pd.MultiIndex.from_tuples(pares, names=['id_docente', 'id_materia'])
+        )
+        resultado['base'] = [self._cache[clave][1] for clave in claves]
+        resultado['prediccion'] = resultado['base'] + resultado[self.feature_cols].sum(axis=1)
+        return resultado
+
+    def explicar_top(self, df_asignaciones, id_materia, top_k=10):
+        """Explica solo el top-K por `prob_alta` de una materia"""
+        asignaciones_materia = df_asignaciones[df_asignaciones['id_materia'] == id_materia]
+        return self.explicar(asignaciones_materia.nlargest(top_k, 'prob_alta'))
+
+    def limpiar_cache(self):
+        self._cache.clear()
+
+
+def principales_contribuciones(explicacion, n=5, feature_cols=FEATURE_COLS):
+    """Las n features con mayor contribución absoluta de cada fila, en formato largo"""
+    filas = []
+    for clave, fila in explicacion[list(feature_cols)].iterrows():
+        for feature in fila.abs().nlargest(n).index:
+            filas.append({
+                'id_docente': clave[0],
+                'id_materia': clave[1],
+                'feature': feature,
+                'contribucion': fila[feature]
+            })
+    return pd.DataFrame(filas)
@@ -0,0 +1,218 @@
+"""
+Planificador de entrenamiento con presupuesto global de núcleos
+
+Evita la sobresuscripción de hilos del notebook (RandomForest, XGBoost y
+GridSearchCV con `n_jobs=-1` a la vez) sin exceder un presupuesto de núcleos:
+
+1. Búsqueda: los ajustes (candidato × fold) de todos los trabajos se aplanan
+   en un único `joblib.Parallel` dimensionado al presupuesto, con `interno`
+   hilos por ajuste. No se lanzan varias búsquedas de joblib desde hilos:
+   comparten el executor loky del proceso y se bloquean al redimensionarlo.
+2. Ajuste final: el mejor candidato de cada trabajo (o el estimador, si no
+   tiene búsqueda) se entrena con todos los datos, todos los trabajos a la
+   vez, cada uno con su parte de núcleos. El paralelismo interno de estos
+   estimadores debe ser por hilos (RandomForest, XGBoost), no por procesos.
+
+La parte de cada trabajo es proporcional a su costo, que por defecto es su
+número de ajustes (candidatos × folds, o 1 sin búsqueda): un RandomForest
+completo cuenta como un solo fold de XGBoost y recibiría 1 núcleo de 16.
+Para repartos realistas indique `costo` en la misma unidad (p. ej. un RF de
+100 árboles ≈ 20 folds de XGBoost).
+
+Ejemplo:
+    trabajos = [
+        TrabajoEntrenamiento('random_forest', rf_model, costo=20),
+        TrabajoEntrenamiento('xgboost', xgb_base, param_grid=param_grid,
+                             cv=cv_strategy, scoring='f1_weighted'),
+    ]
+    resultado = entrenar_con_presupuesto(trabajos, X_train_scaled, y_train, presupuesto=16)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier
+from sklearn.metrics import check_scoring
+from sklearn.model_selection import ParameterGrid, check_cv
+
+
+class TrabajoEntrenamiento:
+    """Un modelo a entrenar, con o sin búsqueda de hiperparámetros"""
+
+    def __init__(self, nombre, estimador, param_grid=None, cv=None, scoring=None, costo=None):
+        self.nombre = nombre
+        self.estimador = estimador
+        self.param_grid = param_grid
+        self.cv = cv
+        self.scoring = scoring
+        self.costo = costo
+
+    def candidatos(self):
+        return list(ParameterGrid(self.param_grid)) if self.param_grid is not None else []
+
+    def num_tareas(self):
+        """Número de ajustes independientes (candidatos × folds, o 1)"""
+        if self.param_grid is None:
+            return 1
+        return len(ParameterGrid(self.param_grid)) * check_cv(self.cv).get_n_splits()
+
+    def costo_estimado(self):
+        return self.costo if self.costo is not None else self.num_tareas()
+
+
+def repartir_nucleos(trabajos, presupuesto):
+    """Reparte el presupuesto entre trabajos en proporción a su costo (mínimo 1)"""
+    if presupuesto < len(trabajos):
+        raise ValueError(f"Presupuesto de {presupuesto} núcleos insuficiente para {len(trabajos)} trabajos")
+
+    costos = [trabajo.costo_estimado() for trabajo in trabajos]
+    total = sum(costos)
+    libres = presupuesto - len(trabajos)
+    exactos = [libres * costo / total for costo in costos]
+    nucleos = [1 + int(valor) for valor in exactos]
+
+    # Método del resto mayor para no dejar núcleos sin asignar
+    restantes = presupuesto - sum(nucleos)
+    orden = sorted(range(len(trabajos)), key=lambda i: exactos[i] - int(exactos[i]), reverse=True)
+    for i in orden[:restantes]:
+        nucleos[i] += 1
+    return nucleos
+
+
+def dividir_paralelismo(num_tareas, nucleos):
+    """Divide `nucleos` en (externo, interno) para `num_tareas` ajustes independientes"""
+    externo = max(1, min(num_tareas, nucleos))
+    interno = max(1, nucleos // externo)
+    return externo, interno
+
+
+def _con_hilos(estimador, hilos):
+    if 'n_jobs' in estimador.get_params():
+        estimador.set_params(n_jobs=hilos)
+    return estimador
+
+
+def _filas(datos, indices):
+    return datos.iloc[indices] if hasattr(datos, 'iloc') else datos[indices]
+
+
+def _evaluar_candidato(estimador, parametros, scoring, hilos, X, y, entrenamiento, prueba):
+    """Ajusta un candidato en un fold; devuelve (puntaje, segundos)"""
+    inicio = time.perf_counter()
+    modelo = _con_hilos(clone(estimador).set_params(**parametros), hilos)
+    modelo.fit(_filas(X, entrenamiento), _filas(y, entrenamiento))
+    puntaje = check_scoring(modelo, scoring=scoring)(modelo, _filas(X, prueba), _filas(y, prueba))
+    return puntaje, time.perf_counter() - inicio
+
+
+def _ajuste_final(estimador, parametros, hilos, X, y):
+    """Entrena con todos los datos; devuelve (modelo, segundos)"""
+    inicio = time.perf_counter()
+    modelo = _con_hilos(clone(estimador).set_params(**parametros), hilos).fit(X, y)
+    return modelo, time.perf_counter() - inicio
+
+
+def _buscar(trabajos, presupuesto, X, y):
+    """
+    Evalúa en un solo `joblib.Parallel` todos los (candidato × fold) de los
+    trabajos con búsqueda. Devuelve ({nombre: resultados}, segundos por
+    trabajo, (externo, interno), núcleos-segundo usados).
+    """
+    tareas = []
+    for i, trabajo in enumerate(trabajos):
+        if trabajo.param_grid is None:
+            continue
+        cv = check_cv(trabajo.cv, y, classifier=is_classifier(trabajo.estimador))
+        folds = list(cv.split(X, y))
+        for c, parametros in enumerate(trabajo.candidatos()):
+            for entrenamiento, prueba in folds:
+                tareas.append((i, c, parametros, entrenamiento, prueba))
+    if not tareas:
+        return {}, {}, (0, 0), 0.0
+
+    externo, interno = dividir_paralelismo(len(tareas), presupuesto)
+    salidas = Parallel(n_jobs=externo)(
+        delayed(_evaluar_candidato)(trabajos[i].estimador, parametros, trabajos[i].scoring, interno,
+                                    X, y, entrenamiento, prueba)
+        for i, _, parametros, entrenamiento, prueba in tareas
+    )
+
+    puntajes = {}
+    segundos = {}
+    for (i, c, _, _, _), (puntaje, duracion) in zip(tareas, salidas):
+        puntajes.setdefault(i, {}).setdefault(c, []).append(puntaje)
+        segundos[i] = segundos.get(i, 0.0) + duracion
+
+    resultados = {}
+    for i, por_candidato in puntajes.items():
+        candidatos = trabajos[i].candidatos()
+        medias = np.array([np.mean(por_candidato[c]) for c in range(len(candidatos))])
+        resultados[trabajos[i].nombre] = pd.DataFrame({
+            'params': candidatos,
+            'mean_test_score': medias,
+            'std_test_score': [np.std(por_candidato[c]) for c in range(len(candidatos))],
+            'rank_test_score': pd.Series(-medias).rank(method='min').astype(int).to_numpy()
+        })
+    return resultados, segundos, (externo, interno), interno * sum(duracion for _, duracion in salidas)
+
+
+def entrenar_con_presupuesto(trabajos, X, y, presupuesto=None):
+    """
+    Busca y entrena todos los trabajos sin exceder `presupuesto` núcleos.
+
+    Devuelve un dict con:
+    - 'modelos': el mejor candidato de cada trabajo entrenado con todos los
+      datos y `n_jobs` = núcleos del trabajo
+    - 'busquedas': por trabajo con búsqueda, un DataFrame con params,
+      mean/std_test_score y rank_test_score (como `cv_results_`), o None
+    - 'reporte': núcleos, tareas y segundos de búsqueda (suma de sus ajustes)
+      y de ajuste final por trabajo
+    - 'tiempo_busqueda' y 'tiempo_total' (reloj)
+    - 'ocupacion_asignada': núcleos-segundo asignados / (presupuesto × tiempo
+      total). Es ocupación planificada, no uso de CPU medido.
+    """
+    presupuesto = presupuesto or os.cpu_count() or 1
+    nucleos = repartir_nucleos(trabajos, presupuesto)
+
+    inicio = time.perf_counter()
+    busquedas, segundos_busqueda, (externo, interno), nucleos_segundo = _buscar(trabajos, presupuesto, X, y)
+    tiempo_busqueda = time.perf_counter() - inicio
+
+    parametros = [
+        busquedas[trabajo.nombre].sort_values('rank_test_score', kind='mergesort')['params'].iloc[0]
+        if trabajo.nombre in busquedas else {}
+        for trabajo in trabajos
+    ]
+    with ThreadPoolExecutor(max_workers=len(trabajos)) as executor:
+        futuros = [
+            executor.submit(_ajuste_final, trabajo.estimador, params, n, X, y)
+            for trabajo, params, n in zip(trabajos, parametros, nucleos)
+        ]
+        finales = [futuro.result() for futuro in futuros]
+    tiempo_total = time.perf_counter() - inicio
+
+    reporte = pd.DataFrame([
+        {
+            'trabajo': trabajo.nombre,
+            'nucleos': n,
+            'tareas': trabajo.num_tareas() if trabajo.param_grid is not None else 0,
+            'segundos_busqueda': round(segundos_busqueda.get(i, 0.0), 2),
+            'segundos_ajuste_final': round(segundos, 2)
+        }
+        for i, (trabajo, n, (_, segundos)) in enumerate(zip(trabajos, nucleos, finales))
+    ])
+    reporte.attrs['paralelismo_busqueda'] = {'externo': externo, 'hilos_internos': interno}
+    nucleos_segundo += sum(n * segundos for n, (_, segundos) in zip(nucleos, finales))
+
+    return {
+        'modelos': {trabajo.nombre: modelo for trabajo, (modelo, _) in zip(trabajos, finales)},
+        'busquedas': {trabajo.nombre: busquedas.get(trabajo.nombre) for trabajo in trabajos},
+        'reporte': reporte,
+        'tiempo_busqueda': tiempo_busqueda,
+        'tiempo_total': tiempo_total,
+        'ocupacion_asignada': nucleos_segundo / (presupuesto * tiempo_total) if tiempo_total > 0 else 0.0
+    }
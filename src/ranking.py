@@ -0,0 +1,81 @@
+"""
+Rankings de docentes por materia (versión reutilizable de FASE 10)
+
+Construye de una sola vez el índice de rankings de todas las materias a
+partir de las predicciones de `df_asignaciones`, con la misma tabla de
+recomendación y los mismos colores Match/Prefiere del notebook.
+"""
+
+import pandas as pd
+
+# ============================================
+# COLORES DEL GRÁFICO DE RANKING
+# ============================================
+COLOR_MATCH_PREFIERE = '#27ae60'  # Verde oscuro: Match + Prefiere
+COLOR_MATCH = '#3498db'           # Azul: Solo match
+COLOR_SIN_MATCH = '#e74c3c'       # Rojo: Sin match
+
+
+def construir_indice_ranking(df_asignaciones, df_docentes, df_materias, top_n=10):
+    """
+    Devuelve {codigo_materia: {'materia': dict, 'recomendacion': DataFrame}}.
+
+    `df_asignaciones` debe tener la columna `prob_alta` (predicción del modelo).
+    """
+    materias = df_materias.copy()
+    materias['codigo'] = materias['codigo'].astype(str).str.strip()
+
+    columnas_docente = ['id_docente'] + [
+        col for col in ['nombres_completos', 'materias_preferidas'] if col not in df_asignaciones.columns
+    ]
+    top = (
+        df_asignaciones
+        .sort_values(['id_materia', 'prob_alta'], ascending=[True, False], kind='mergesort')
+        .groupby('id_materia', sort=False)
+        .head(top_n)
+        .merge(df_docentes[columnas_docente], on='id_docente', how='left')
+    )
+    top_por_materia = dict(tuple(top.groupby('id_materia', sort=False)))
+
+    indice = {}
+    for materia in materias.to_dict('records'):
+        ranking = top_por_materia.get(materia['id_materia'])
+        if ranking is None:
+            continue
+        indice[materia['codigo']] = {
+            'materia': materia,
+            'recomendacion': tabla_recomendacion(ranking, materia['nombre'])
+        }
+    return indice
+
+
+def tabla_recomendacion(ranking_completo, nombre_materia):
+    """Tabla de recomendación con las mismas columnas que el notebook"""
+    nombre_materia_upper = nombre_materia.upper()
+    en_preferencias = ranking_completo['materias_preferidas'].apply(
+        lambda x: '✅' if pd.notna(x) and nombre_materia_upper in x.upper() else '❌'
+    )
+
+    return pd.DataFrame({
+        'Pos': range(1, len(ranking_completo) + 1),
+        'ID Docente': ranking_completo['id_docente'].values,
+        'Nombre Docente': ranking_completo['nombres_completos'].str[:35].values,
+        'Área': ranking_completo['area_docente'].values,
+        'Match': ranking_completo['match_area'].map({1: '✅', 0: '❌'}).values,
+        'Idoneidad': ranking_completo['score_idoneidad'].values.round(1),
+        'Prob.Alta': (ranking_completo['prob_alta'] * 100).values.round(1),
+        'Prefiere': en_preferencias.values
+    })
+
+
+def colores_ranking(recomendacion):
+    """Color de cada barra según Match de área y preferencia declarada"""
+    colores = []
+    for match, prefiere in zip(recomendacion['Match'], recomendacion['Prefiere']):
+        if match == '✅' and prefiere == '✅':
+            colores.append(COLOR_MATCH_PREFIERE)
+        elif match == '✅':
+            colores.append(COLOR_MATCH)
+        else:
+            colores.append(COLOR_SIN_MATCH)
+    return colores
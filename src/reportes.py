@@ -0,0 +1,126 @@
+"""
+Exportación en lote de los reportes de ranking por materia
+
+Genera, para cada materia del catálogo, la tabla de recomendación (CSV y
+HTML) y el gráfico de barras con los colores Match/Prefiere (PNG), sin
+ventanas interactivas. Las materias se reparten en un pool de procesos que
+comparte el índice de rankings en modo solo lectura.
+"""
+
+import html
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+from .ranking import (
+    COLOR_MATCH,
+    COLOR_MATCH_PREFIERE,
+    COLOR_SIN_MATCH,
+    colores_ranking,
+    construir_indice_ranking,
+)
+
+# Índice compartido por cada proceso del pool (se fija en el inicializador)
+_INDICE_RANKING = None
+_DIRECTORIO_SALIDA = None
+
+
+def _inicializar_proceso(indice, directorio):
+    global _INDICE_RANKING, _DIRECTORIO_SALIDA
+    _INDICE_RANKING = indice
+    _DIRECTORIO_SALIDA = directorio
+
+
+def _graficar_ranking(recomendacion, materia, ruta_png):
+    """Gráfico de barras horizontal (backend Agg, sin pyplot)"""
+    top = recomendacion.head(10)
+    fig = Figure(figsize=(14, 6))
+    ax = fig.add_subplot()
+    ax.barh(top['Nombre Docente'], top['Prob.Alta'], color=colores_ranking(top))
+    ax.set_xlabel('Probabilidad de Alta Efectividad (%)', fontsize=12, fontweight='bold')
+    ax.set_title(f'Top 10 Docentes - {materia["nombre"][:50]}...', fontsize=13, fontweight='bold')
+    ax.invert_yaxis()
+    ax.legend(handles=[
+        Patch(facecolor=COLOR_MATCH_PREFIERE, label='Match Área + Eligió Materia'),
+        Patch(facecolor=COLOR_MATCH, label='Match Área'),
+        Patch(facecolor=COLOR_SIN_MATCH, label='Sin Match')
+    ], loc='lower right')
+    fig.tight_layout()
+    fig.savefig(ruta_png, dpi=100)
+
+
+def _escribir_html(recomendacion, materia, ruta_html, nombre_png):
+    encabezado = (
+        f"<h2>{html.escape(materia['nombre'])}</h2>\n"
+        f"<p>Código: {html.escape(str(materia['codigo']))} | "
+        f"Área: {html.escape(materia['area_conocimiento'])} | "
+        f"Semestre: {materia['semestre']} | "
+        f"Complejidad: {html.escape(materia['nivel_complejidad'])}</p>\n"
+    )
+    contenido = (
+        "<!DOCTYPE html>\n<html lang=\"es\">\n<head><meta charset=\"utf-8\">"
+        f"<title>Ranking {html.escape(str(materia['codigo']))}</title></head>\n<body>\n"
+        f"{encabezado}{recomendacion.to_html(index=False)}\n"
+        f"<img src=\"{nombre_png}\" alt=\"Top 10 docentes\">\n</body>\n</html>\n"
+    )
+    with open(ruta_html, 'w', encoding='utf-8') as archivo:
+        archivo.write(contenido)
+
+
+def _exportar_materia(codigo):
+    entrada = _INDICE_RANKING[codigo]
+    materia, recomendacion = entrada['materia'], entrada['recomendacion']
+    base = os.path.join(_DIRECTORIO_SALIDA, f'ranking_{codigo}')
+
+    recomendacion.to_csv(f'{base}.csv', index=False, encoding='utf-8')
+    _graficar_ranking(recomendacion, materia, f'{base}.png')
+    _escribir_html(recomendacion, materia, f'{base}.html', os.path.basename(f'{base}.png'))
+
+    return {
+        'codigo': codigo,
+        'nombre': materia['nombre'],
+        'area': materia['area_conocimiento'],
+        'docentes': len(recomendacion),
+        'csv': f'{base}.csv',
+        'png': f'{base}.png',
+        'html': f'{base}.html'
+    }
+
+
+def exportar_reportes(df_asignaciones, df_docentes, df_materias, directorio='reportes',
+                      top_n=10, codigos=None, max_procesos=None):
+    """
+    Exporta el ranking de cada materia a CSV/HTML/PNG en `directorio`.
+
+    Por defecto exporta todo el catálogo; `codigos` limita la lista. Devuelve
+    un DataFrame con las rutas generadas y escribe un `index.html` con enlaces.
+    """
+    os.makedirs(directorio, exist_ok=True)
+    indice = construir_indice_ranking(df_asignaciones, df_docentes, df_materias, top_n=top_n)
+    codigos = [str(c).strip() for c in codigos] if codigos is not None else list(indice)
+
+    faltantes = [c for c in codigos if c not in indice]
+    if faltantes:
+        raise KeyError(f"Materias no encontradas: {faltantes}")
+
+    procesos = max_procesos or os.cpu_count() or 1
+    chunksize = max(1, len(codigos) // (4 * procesos))
+    with ProcessPoolExecutor(max_workers=procesos, initializer=_inicializar_proceso,
+                             initargs=(indice, directorio)) as executor:
+        generados = list(executor.map(_exportar_materia, codigos, chunksize=chunksize))
+
+    resumen = pd.DataFrame(generados)
+    enlaces = '\n'.join(
+        f"<li><a href=\"{os.path.basename(fila['html'])}\">{html.escape(fila['codigo'])} - "
+        f"{html.escape(fila['nombre'])}</a> ({html.escape(fila['area'])})</li>"
+        for _, fila in resumen.iterrows()
+    )
+    with open(os.path.join(directorio, 'index.html'), 'w', encoding='utf-8') as archivo:
+        archivo.write(
+            "<!DOCTYPE html>\n<html lang=\"es\">\n<head><meta charset=\"utf-8\">"
+            f"<title>Rankings por materia</title></head>\n<body>\n<ul>\n{enlaces}\n</ul>\n</body>\n</html>\n"
+        )
+    return resumen
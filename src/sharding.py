@@ -0,0 +1,272 @@
+"""
+Ejecución del pipeline particionada por carrera
+
+Cada carrera tiene su propio catálogo de materias y comparte parte de los
+docentes. Como el ranking top-N es independiente por materia, las carreras
+grandes se dividen en shards de a lo sumo `max_materias_por_shard` materias;
+para cada shard se construyen los pares docente × materia, se predice
+`prob_alta` y se arma el ranking, y los shards de una carrera se unen antes
+de combinar la carga de cada docente entre carreras.
+
+Los shards se ejecutan en un pool de procesos (cada proceso carga el modelo
+una sola vez) o en varias máquinas que comparten un directorio: cada nodo
+procesa sus shards con `ejecutar_nodo`, que escribe un manifiesto por
+ejecución, y cualquiera de ellos combina con `combinar_directorio` solo los
+archivos listados en los manifiestos de esa ejecución.
+
+Columnas opcionales:
+- `carrera` en materias (si falta o está vacía, CARRERA_POR_DEFECTO).
+- `carreras` en docentes, separadas por '|' (si falta, todos los docentes
+  participan en todas las carreras). Una carrera sin docentes elegibles
+  produce un ranking vacío y 0 pares.
+"""
+
+import hashlib
+import json
+import math
+import os
+import pickle
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from .config import CARRERA_POR_DEFECTO, CLASE_ALTA, FEATURE_COLS
+from .data_loader import construir_asignaciones
+
+# Materias por shard en ejecuciones multi-nodo: debe ser igual en todos los
+# nodos para que calculen el mismo reparto
+MATERIAS_POR_SHARD = 25
+
+COLUMNAS_RANKING = ['id_materia', 'id_docente', 'area_materia', 'match_area', 'score_idoneidad', 'creditos', 'prob_alta']
+
+# Estado por proceso (se fija en el inicializador)
+_MODELO = None
+_SCALER = None
+_DOCENTES = None
+
+
+def _inicializar_proceso(ruta_artefactos, df_docentes):
+    global _MODELO, _SCALER, _DOCENTES
+    with open(ruta_artefactos, 'rb') as archivo:
+        artefactos = pickle.load(archivo)
+    _MODELO = artefactos['modelo']
+    _SCALER = artefactos['scaler']
+    _DOCENTES = df_docentes
+
+
+def particionar_por_carrera(df_materias):
+    """{carrera: materias de la carrera}; las materias sin carrera van a CARRERA_POR_DEFECTO"""
+    if 'carrera' not in df_materias.columns:
+        return {CARRERA_POR_DEFECTO: df_materias}
+    carreras = df_materias['carrera'].fillna(CARRERA_POR_DEFECTO)
+    return {carrera: grupo for carrera, grupo in df_materias.groupby(carreras, sort=True)}
+
+
+def subdividir_shards(shards, max_materias):
+    """{(carrera, parte): materias}, con a lo sumo `max_materias` materias por parte"""
+    if max_materias < 1:
+        raise ValueError("max_materias debe ser al menos 1")
+    subshards = {}
+    for carrera, materias in shards.items():
+        for parte, inicio in enumerate(range(0, len(materias), max_materias)):
+            subshards[(carrera, parte)] = materias.iloc[inicio:inicio + max_materias]
+    return subshards
+
+
+def docentes_de_carrera(df_docentes, carrera):
+    """Docentes que pueden dictar en `carrera`"""
+    if 'carreras' not in df_docentes.columns:
+        return df_docentes
+    mascara = df_docentes['carreras'].fillna('').str.split('|').apply(
+        lambda carreras: carrera in [nombre.strip() for nombre in carreras]
+    )
+    return df_docentes[mascara]
+
+
+def shards_para_nodo(shards, indice_nodo, total_nodos):
+    """
+    Asignación determinista de shards a nodos (mayor número de materias
+    primero, al nodo menos cargado). Todos los nodos calculan el mismo reparto.
+    Devuelve las claves de `shards` asignadas a `indice_nodo`.
+    """
+    cargas = [0] * total_nodos
+    asignacion = [[] for _ in range(total_nodos)]
+    for clave, materias in sorted(shards.items(), key=lambda item: (-len(item[1]), item[0])):
+        nodo = cargas.index(min(cargas))
+        asignacion[nodo].append(clave)
+        cargas[nodo] += len(materias)
+    return asignacion[indice_nodo]
+
+
+def _procesar_shard(carrera, df_materias, top_n):
+    """Pares, predicción y ranking top-N de las materias de un shard de `carrera`"""
+    docentes = docentes_de_carrera(_DOCENTES, carrera)
+    df_asignaciones = construir_asignaciones(docentes, df_materias)
+    if df_asignaciones.empty:
+        df_asignaciones['prob_alta'] = pd.Series(dtype=float)
+    else:
+        X = _SCALER.transform(df_asignaciones[FEATURE_COLS])
+        df_asignaciones['prob_alta'] = _MODELO.predict_proba(X)[:, CLASE_ALTA]
+
+    ranking = (
+        df_asignaciones
+        .sort_values(['id_materia', 'prob_alta'], ascending=[True, False], kind='mergesort')
+        .groupby('id_materia', sort=False)
+        .head(top_n)
+        [COLUMNAS_RANKING]
+    )
+    ranking.insert(0, 'carrera', carrera)
+    ranking.insert(2, 'pos', ranking.groupby('id_materia', sort=False).cumcount() + 1)
+    return ranking.reset_index(drop=True), len(df_asignaciones)
+
+
+def combinar_carga_docentes(ranking):
+    """Carga combinada por docente entre carreras (apariciones y créditos como 1er recomendado)"""
+    primeros = ranking[ranking['pos'] == 1]
+    carga = ranking.groupby('id_docente').agg(
+        materias_en_top_n=('id_materia', 'size'),
+        carreras=('carrera', 'nunique')
+    )
+    carga['materias_primer_lugar'] = primeros.groupby('id_docente').size()
+    carga['creditos_primer_lugar'] = primeros.groupby('id_docente')['creditos'].sum()
+    carga = carga.fillna(0).astype(int)
+    return carga.sort_values(['creditos_primer_lugar', 'materias_en_top_n'], ascending=False).reset_index()
+
+
+def _ejecutar_subshards(df_docentes, subshards, ruta_artefactos, top_n, max_procesos):
+    """{(carrera, parte): (ranking, pares)} procesando los subshards en un pool de procesos"""
+    with ProcessPoolExecutor(max_workers=max_procesos, initializer=_inicializar_proceso,
+                             initargs=(ruta_artefactos, df_docentes)) as executor:
+        futuros = {clave: executor.submit(_procesar_shard, clave[0], materias, top_n)
+                   for clave, materias in subshards.items()}
+        return {clave: futuro.result() for clave, futuro in futuros.items()}
+
+
+def ejecutar_shards(df_docentes, df_materias, ruta_artefactos, carreras=None, top_n=10, max_procesos=None,
+                    max_materias_por_shard=None):
+    """
+    Ejecuta los shards (todas las carreras o `carreras`) en un pool de procesos.
+
+    Sin `max_materias_por_shard`, las materias se reparten en al menos tantos
+    shards como procesos, así una sola carrera grande también usa todo el pool.
+
+    Devuelve un dict con 'ranking' (formato largo, todas las carreras),
+    'carga_docentes' (combinada entre carreras) y 'pares' por carrera.
+    """
+    shards = particionar_por_carrera(df_materias)
+    carreras = list(shards) if carreras is None else list(carreras)
+    shards = {carrera: shards[carrera] for carrera in carreras}
+
+    if max_materias_por_shard is None:
+        procesos = max_procesos or os.cpu_count() or 1
+        total_materias = sum(len(materias) for materias in shards.values())
+        max_materias_por_shard = max(1, math.ceil(total_materias / procesos))
+    resultados = _ejecutar_subshards(df_docentes, subdividir_shards(shards, max_materias_por_shard),
+                                     ruta_artefactos, top_n, max_procesos)
+
+    ranking = pd.concat([resultado[0] for resultado in resultados.values()], ignore_index=True)
+    pares = {carrera: 0 for carrera in carreras}
+    for (carrera, _), (_, num_pares) in resultados.items():
+        pares[carrera] += num_pares
+    return {
+        'ranking': ranking,
+        'carga_docentes': combinar_carga_docentes(ranking),
+        'pares': pares
+    }
+
+
+# ============================================
+# VARIOS NODOS CON DIRECTORIO COMPARTIDO
+# ============================================
+def _nombre_archivo(id_ejecucion, carrera, parte):
+    # El nombre legible pierde tildes y puntuación; la huella del nombre
+    # original distingue carreras como 'Ing. Civil' e 'Ing Civil'
+    sin_tildes = unicodedata.normalize('NFKD', carrera).encode('ascii', 'ignore').decode('ascii')
+    nombre = re.sub(r'[^A-Za-z0-9]+', '_', sin_tildes).strip('_').lower()
+    huella = hashlib.sha1(carrera.encode('utf-8')).hexdigest()[:8]
+    return f'{id_ejecucion}_shard_{nombre}_{huella}_{parte:03d}.csv'
+
+
+def _nombre_manifiesto(id_ejecucion, indice_nodo):
+    return f'{id_ejecucion}_manifiesto_nodo_{indice_nodo:03d}.json'
+
+
+def _escribir_atomico(ruta, escribir):
+    temporal = f'{ruta}.tmp'
+    escribir(temporal)
+    os.replace(temporal, ruta)
+
+
+def ejecutar_nodo(df_docentes, df_materias, ruta_artefactos, directorio, indice_nodo, total_nodos, id_ejecucion,
+                  top_n=10, max_procesos=None, max_materias_por_shard=MATERIAS_POR_SHARD):
+    """
+    Procesa los shards que le tocan a este nodo y los escribe en `directorio`.
+
+    Todos los nodos de una ejecución usan el mismo `id_ejecucion` y
+    `max_materias_por_shard`. Al terminar escribe el manifiesto del nodo con
+    los archivos producidos (también si no le tocó ningún shard).
+    """
+    os.makedirs(directorio, exist_ok=True)
+    subshards = subdividir_shards(particionar_por_carrera(df_materias), max_materias_por_shard)
+    claves = shards_para_nodo(subshards, indice_nodo, total_nodos)
+
+    resultados = {}
+    if claves:
+        resultados = _ejecutar_subshards(df_docentes, {clave: subshards[clave] for clave in claves},
+                                         ruta_artefactos, top_n, max_procesos)
+    archivos = []
+    for (carrera, parte), (ranking, _) in resultados.items():
+        archivo = _nombre_archivo(id_ejecucion, carrera, parte)
+        _escribir_atomico(os.path.join(directorio, archivo),
+                          lambda ruta: ranking.to_csv(ruta, index=False, encoding='utf-8'))
+        archivos.append(archivo)
+
+    manifiesto = {
+        'id_ejecucion': id_ejecucion,
+        'indice_nodo': indice_nodo,
+        'total_nodos': total_nodos,
+        'max_materias_por_shard': max_materias_por_shard,
+        'archivos': archivos
+    }
+
+    def _escribir_manifiesto(ruta):
+        with open(ruta, 'w', encoding='utf-8') as archivo:
+            json.dump(manifiesto, archivo, ensure_ascii=False, indent=2)
+
+    _escribir_atomico(os.path.join(directorio, _nombre_manifiesto(id_ejecucion, indice_nodo)), _escribir_manifiesto)
+    return [os.path.join(directorio, archivo) for archivo in archivos]
+
+
+def combinar_directorio(directorio, id_ejecucion):
+    """
+    Une los shards de la ejecución `id_ejecucion` listados en los manifiestos
+    de sus nodos y combina la carga docente. Falla si falta el manifiesto de
+    algún nodo o si los nodos no usaron el mismo reparto.
+    """
+    prefijo = f'{id_ejecucion}_manifiesto_nodo_'
+    manifiestos = []
+    for nombre in sorted(os.listdir(directorio)):
+        if nombre.startswith(prefijo) and nombre.endswith('.json'):
+            with open(os.path.join(directorio, nombre), encoding='utf-8') as archivo:
+                manifiestos.append(json.load(archivo))
+    if not manifiestos:
+        raise FileNotFoundError(f"No hay manifiestos de la ejecución '{id_ejecucion}' en '{directorio}'")
+
+    repartos = {(m['total_nodos'], m['max_materias_por_shard']) for m in manifiestos}
+    if len(repartos) > 1:
+        raise ValueError(f"Los nodos de '{id_ejecucion}' usaron repartos distintos: {sorted(repartos)}")
+    total_nodos = manifiestos[0]['total_nodos']
+    faltantes = sorted(set(range(total_nodos)) - {m['indice_nodo'] for m in manifiestos})
+    if faltantes:
+        raise FileNotFoundError(f"Faltan los manifiestos de los nodos {faltantes} de '{id_ejecucion}'")
+
+    archivos = sorted(archivo for m in manifiestos for archivo in m['archivos'])
+    ranking = pd.concat(
+        [pd.read_csv(os.path.join(directorio, archivo), encoding='utf-8', dtype={'id_materia': str})
+         for archivo in archivos],
+        ignore_index=True
+    )
+    ranking = ranking.sort_values(['carrera', 'id_materia', 'pos'], kind='mergesort').reset_index(drop=True)
+    return {'ranking': ranking, 'carga_docentes': combinar_carga_docentes(ranking)}
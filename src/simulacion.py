@@ -0,0 +1,191 @@
+"""
+Simulación Monte Carlo de los resultados esperados de un plan de asignación
+
+A partir de las probabilidades de clase del modelo (prob_baja/media/alta) de
+cada par docente × materia del plan y de la variabilidad histórica de
+`dataset_asignaciones.csv` por clase de efectividad, se sortean decenas de
+miles de periodos completos con operaciones vectorizadas de NumPy (sin bucle
+por ensayo). Devuelve intervalos de confianza de `tasa_aprobacion`,
+`promedio_calificaciones` y de la efectividad, por materia, por docente y
+para todo el periodo.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .config import CLASES_EFECTIVIDAD
+
+COLUMNAS_PROBABILIDAD = ['prob_baja', 'prob_media', 'prob_alta']
+
+
+def estadisticas_historicas(df_historico):
+    """Media, desviación y correlación de tasa/promedio por clase de efectividad"""
+    filas = []
+    for clase in sorted(CLASES_EFECTIVIDAD):
+        grupo = df_historico[df_historico['efectividad_asignacion'] == clase]
+        if len(grupo) < 2:
+            raise ValueError(f"Historial insuficiente para la clase {CLASES_EFECTIVIDAD[clase]}")
+        correlacion = grupo['tasa_aprobacion'].corr(grupo['promedio_calificaciones'])
+        filas.append({
+            'clase': clase,
+            'tasa_media': grupo['tasa_aprobacion'].mean(),
+            'tasa_std': grupo['tasa_aprobacion'].std(),
+            'promedio_media': grupo['promedio_calificaciones'].mean(),
+            'promedio_std': grupo['promedio_calificaciones'].std(),
+            'correlacion': correlacion if pd.notna(correlacion) else 0.0
+        })
+    estadisticas = pd.DataFrame(filas).set_index('clase')
+    estadisticas.attrs['num_estudiantes_medio'] = df_historico['num_estudiantes'].mean()
+    return estadisticas
+
+
+def unir_probabilidades(plan, df_asignaciones):
+    """
+    Añade prob_baja/media/alta de `df_asignaciones` a un plan (id_docente, id_materia).
+    El plan puede repetir un par (un docente con varios paralelos de la misma
+    materia); `df_asignaciones` no. Lanza ValueError si algún par del plan no
+    está en `df_asignaciones` o si este tiene pares repetidos.
+    """
+    if df_asignaciones.duplicated(['id_docente', 'id_materia']).any():
+        raise ValueError("df_asignaciones tiene pares (id_docente, id_materia) repetidos")
+    unido = plan.merge(
+        df_asignaciones[['id_docente', 'id_materia'] + COLUMNAS_PROBABILIDAD],
+        on=['id_docente', 'id_materia'], how='inner', validate='many_to_one'
+    )
+    if len(unido) != len(plan):
+        claves = pd.MultiIndex.from_frame(plan[['id_docente', 'id_materia']])
+        encontradas = pd.MultiIndex.from_frame(unido[['id_docente', 'id_materia']])
+        faltantes = list(claves.difference(encontradas))
+        raise ValueError(f"{len(faltantes)} pares del plan no tienen probabilidades: {faltantes[:5]}")
+    return unido
+
+
+def _matriz_grupos(claves):
+    """Índices de grupo y matriz indicadora (pares × grupos)"""
+    grupos, posiciones = np.unique(np.asarray(claves), return_inverse=True)
+    indicadora = np.zeros((len(claves), len(grupos)))
+    indicadora[np.arange(len(claves)), posiciones] = 1.0
+    return grupos, indicadora
+
+
+def _promedio_por_grupo(valor, pesos, indicadora, peso_grupos, tamano_grupos):
+    """Media ponderada por grupo; sin peso (0 estudiantes) se usa la media simple"""
+    ponderada = (valor * pesos) @ indicadora / np.where(peso_grupos > 0, peso_grupos, 1.0)
+    simple = valor @ indicadora / tamano_grupos
+    return np.where(peso_grupos > 0, ponderada, simple)
+
+
+def _resumen(muestras, nombres, alfa):
+    """Media, desviación e IC por columna de una matriz (ensayos × grupos)"""
+    inferior, superior = np.percentile(muestras, [100 * alfa / 2, 100 * (1 - alfa / 2)], axis=0)
+    return pd.DataFrame({
+        'media': muestras.mean(axis=0),
+        'desviacion': muestras.std(axis=0),
+        'ic_inferior': inferior,
+        'ic_superior': superior
+    }, index=nombres)
+
+
+def simular_plan(plan, df_historico, num_ensayos=20000, nivel_confianza=0.95, semilla=42, tamano_bloque=5000):
+    """
+    Simula `num_ensayos` periodos del plan.
+
+    `plan` necesita id_docente, id_materia y prob_baja/media/alta; si trae
+    `num_estudiantes` se usa para ponderar, si no se toma la media histórica
+    (un grupo sin estudiantes se promedia sin ponderar). Lanza ValueError si
+    alguna probabilidad falta o las de un par no suman 1.
+    Devuelve un dict con DataFrames 'termino', 'materias' y 'docentes' (media,
+    desviación e IC por métrica) y las 'estadisticas' históricas usadas.
+    """
+    faltantes = [col for col in COLUMNAS_PROBABILIDAD if col not in plan.columns]
+    if faltantes:
+        raise ValueError(f"El plan no tiene las columnas {faltantes}; use unir_probabilidades()")
+
+    estadisticas = estadisticas_historicas(df_historico)
+    rng = np.random.default_rng(semilla)
+    alfa = 1 - nivel_confianza
+
+    probabilidades = plan[COLUMNAS_PROBABILIDAD].to_numpy(dtype=np.float64)
+    if np.isnan(probabilidades).any():
+        raise ValueError("El plan tiene probabilidades faltantes (NaN); revise los pares con unir_probabilidades()")
+    sumas = probabilidades.sum(axis=1, keepdims=True)
+    if (probabilidades < 0).any() or not np.allclose(sumas, 1.0, atol=1e-3):
+        raise ValueError("Las probabilidades de cada par deben ser no negativas y sumar 1")
+    probabilidades = probabilidades / sumas
+    umbral_media = probabilidades[:, 0]
+    umbral_alta = probabilidades[:, 0] + probabilidades[:, 1]
+
+    if 'num_estudiantes' in plan.columns:
+        estudiantes = plan['num_estudiantes'].to_numpy(dtype=np.float64)
+        if np.isnan(estudiantes).any() or (estudiantes < 0).any():
+            raise ValueError("num_estudiantes debe ser un número no negativo en todos los pares")
+    else:
+        estudiantes = np.full(len(plan), estadisticas.attrs['num_estudiantes_medio'])
+
+    tasa_media = estadisticas['tasa_media'].to_numpy()
+    tasa_std = estadisticas['tasa_std'].to_numpy()
+    promedio_media = estadisticas['promedio_media'].to_numpy()
+    promedio_std = estadisticas['promedio_std'].to_numpy()
+    correlacion = estadisticas['correlacion'].to_numpy()
+
+    materias, indicadora_materias = _matriz_grupos(plan['id_materia'])
+    docentes, indicadora_docentes = _matriz_grupos(plan['id_docente'])
+    grupos = {
+        'termino': np.ones((len(plan), 1)),
+        'materias': indicadora_materias,
+        'docentes': indicadora_docentes
+    }
+    pesos_grupos = {nivel: (estudiantes @ indicadora, indicadora.sum(axis=0)) for nivel, indicadora in grupos.items()}
+
+    metricas = ['tasa_aprobacion', 'promedio_calificaciones', 'proporcion_alta', 'efectividad_media']
+    acumulado = {
+        'termino': {m: np.empty((num_ensayos, 1), dtype=np.float32) for m in metricas},
+        'materias': {m: np.empty((num_ensayos, len(materias)), dtype=np.float32) for m in metricas},
+        'docentes': {m: np.empty((num_ensayos, len(docentes)), dtype=np.float32) for m in metricas}
+    }
+
+    for inicio in range(0, num_ensayos, tamano_bloque):
+        fin = min(inicio + tamano_bloque, num_ensayos)
+        forma = (fin - inicio, len(plan))
+
+        # Clase de efectividad sorteada por par y ensayo
+        u = rng.random(forma)
+        clase = (u >= umbral_media).astype(np.int64) + (u >= umbral_alta)
+
+        # Resultados con la variabilidad histórica de la clase (normal bivariada)
+        z_tasa = rng.standard_normal(forma)
+        z_promedio = correlacion[clase] * z_tasa + np.sqrt(1 - correlacion[clase] ** 2) * rng.standard_normal(forma)
+        tasa = np.clip(tasa_media[clase] + tasa_std[clase] * z_tasa, 0, 1)
+        promedio = np.clip(promedio_media[clase] + promedio_std[clase] * z_promedio, 0, 10)
+
+        valores = {
+            'tasa_aprobacion': tasa,
+            'promedio_calificaciones': promedio,
+            'proporcion_alta': (clase == 2).astype(np.float64),
+            'efectividad_media': clase.astype(np.float64)
+        }
+        for metrica, valor in valores.items():
+            for nivel, indicadora in grupos.items():
+                acumulado[nivel][metrica][inicio:fin] = _promedio_por_grupo(
+                    valor, estudiantes, indicadora, *pesos_grupos[nivel]
+                )
+
+    def _tabla(nivel, nombres, indice):
+        partes = []
+        for metrica in metricas:
+            resumen = _resumen(acumulado[nivel][metrica], nombres, alfa)
+            partes.append(resumen.add_prefix(f'{metrica}_'))
+        tabla = pd.concat(partes, axis=1)
+        tabla.index.name = indice
+        return tabla.reset_index()
+
+    termino = pd.concat(
+        [_resumen(acumulado['termino'][m], [m], alfa) for m in metricas]
+    ).rename_axis('metrica').reset_index()
+
+    return {
+        'termino': termino,
+        'materias': _tabla('materias', materias, 'id_materia'),
+        'docentes': _tabla('docentes', docentes, 'id_docente'),
+        'estadisticas': estadisticas
+    }
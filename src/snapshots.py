@@ -0,0 +1,223 @@
+"""
+Snapshots de modelo + datos con recarga en caliente
+
+Un `Snapshot` agrupa bajo un identificador de versión el modelo, el scaler,
+la matriz de features escalada, las predicciones y el índice de rankings.
+`AlmacenSnapshots` publica snapshots nuevos con un intercambio atómico de
+referencia (read-copy-update): los lectores toman `almacen.actual` una vez y
+trabajan sobre esa versión sin locks; las consultas en curso terminan con la
+versión anterior y las nuevas ven la nueva. Se guarda un historial corto para
+poder revertir.
+
+Un snapshot no se comparte con quien lo construyó (copia los DataFrames, la
+matriz y el índice de rankings) y sus atributos no se pueden reasignar, pero
+pandas no permite DataFrames de solo lectura: los lectores no deben
+modificar en sitio `df_*` ni el modelo/scaler (que no se copian).
+"""
+
+import copy
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from .config import CLASE_ALTA, FEATURE_COLS
+from .data_loader import construir_asignaciones
+from .ranking import construir_indice_ranking
+
+logger = logging.getLogger(__name__)
+
+
+class CargaDescartada(RuntimeError):
+    """Snapshot cargado en segundo plano que llegó después de un `revertir()`"""
+
+
+class Snapshot:
+    """Versión de modelo, scaler, features y rankings con atributos fijos"""
+
+    __slots__ = ('version', 'modelo', 'scaler', 'df_docentes', 'df_materias',
+                 'df_asignaciones', 'X', 'indice_ranking', 'creado')
+
+    def __init__(self, version, modelo, scaler, df_docentes, df_materias, df_asignaciones, X, indice_ranking):
+        # Copias propias: quien construyó el snapshot no puede alterarlo después
+        X = np.array(X, copy=True)
+        X.setflags(write=False)
+        valores = {
+            'version': version,
+            'modelo': modelo,
+            'scaler': scaler,
+            'df_docentes': df_docentes.copy(),
+            'df_materias': df_materias.copy(),
+            'df_asignaciones': df_asignaciones.copy(),
+            'X': X,
+            'indice_ranking': copy.deepcopy(indice_ranking),
+            'creado': time.time()
+        }
+        for nombre, valor in valores.items():
+            object.__setattr__(self, nombre, valor)
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Los atributos de un Snapshot no se reasignan; construya uno nuevo y publíquelo")
+
+    def ranking(self, codigo_materia):
+        """Tabla de recomendación de una materia (copia, para no alterar el snapshot)"""
+        codigo = str(codigo_materia).strip()
+        if codigo not in self.indice_ranking:
+            raise KeyError(f"Materia '{codigo}' no encontrada en el snapshot {self.version}")
+        return self.indice_ranking[codigo]['recomendacion'].copy()
+
+    def __repr__(self):
+        return f"Snapshot(version={self.version!r}, asignaciones={len(self.df_asignaciones):,})"
+
+
+def construir_snapshot(version, modelo, scaler, df_docentes, df_materias, top_n=10, feature_cols=FEATURE_COLS):
+    """Construye pares, predicciones y rankings para un modelo y unos datos dados"""
+    df_asignaciones = construir_asignaciones(df_docentes, df_materias)
+    X = scaler.transform(df_asignaciones[feature_cols])
+
+    proba = modelo.predict_proba(X)
+    df_asignaciones['pred_efectividad'] = proba.argmax(axis=1)
+    df_asignaciones['prob_baja'] = proba[:, 0]
+    df_asignaciones['prob_media'] = proba[:, 1]
+    df_asignaciones['prob_alta'] = proba[:, CLASE_ALTA]
+
+    indice = construir_indice_ranking(df_asignaciones, df_docentes, df_materias, top_n=top_n)
+    return Snapshot(version, modelo, scaler, df_docentes, df_materias, df_asignaciones, X, indice)
+
+
+# ============================================
+# ARTEFACTOS EN DISCO (models/*.pkl)
+# ============================================
+def guardar_artefactos(ruta, modelo, scaler):
+    """Guarda {'modelo', 'scaler'} de forma atómica (archivo temporal + os.replace)"""
+    temporal = f'{ruta}.tmp'
+    with open(temporal, 'wb') as archivo:
+        pickle.dump({'modelo': modelo, 'scaler': scaler}, archivo)
+    os.replace(temporal, ruta)
+
+
+def _huella_archivos(*rutas):
+    huella = hashlib.sha1()
+    for ruta in rutas:
+        with open(ruta, 'rb') as archivo:
+            for bloque in iter(lambda: archivo.read(1 << 20), b''):
+                huella.update(bloque)
+    return huella.hexdigest()[:12]
+
+
+def cargar_snapshot(ruta_artefactos, ruta_docentes, ruta_materias, version=None, top_n=10):
+    """Carga modelo/scaler y datasets desde disco y construye el snapshot"""
+    with open(ruta_artefactos, 'rb') as archivo:
+        artefactos = pickle.load(archivo)
+    df_docentes = pd.read_csv(ruta_docentes, encoding='utf-8')
+    df_materias = pd.read_csv(ruta_materias, encoding='utf-8')
+    df_materias['codigo'] = df_materias['codigo'].astype(str).str.strip()
+
+    version = version or _huella_archivos(ruta_artefactos, ruta_docentes, ruta_materias)
+    return construir_snapshot(version, artefactos['modelo'], artefactos['scaler'],
+                              df_docentes, df_materias, top_n=top_n)
+
+
+# ============================================
+# PUBLICACIÓN (READ-COPY-UPDATE)
+# ============================================
+class AlmacenSnapshots:
+    """
+    Referencia atómica al snapshot vigente, con historial para revertir.
+
+    `revertir()` invalida las cargas en segundo plano ya iniciadas: al
+    terminar, `publicar` las rechaza con CargaDescartada en lugar de pisar la
+    versión restaurada.
+    """
+
+    def __init__(self, snapshot=None, max_historial=5):
+        self._actual = snapshot
+        self._historial = deque(maxlen=max_historial)
+        self._generacion = 0
+        self._lock_escritura = threading.Lock()
+        self._cargador = ThreadPoolExecutor(max_workers=1, thread_name_prefix='snapshot')
+
+    @property
+    def actual(self):
+        """Snapshot vigente. Lectura sin locks: leer la referencia es atómico."""
+        return self._actual
+
+    def publicar(self, snapshot, generacion=None):
+        """
+        Intercambia el snapshot vigente; el anterior pasa al historial.
+
+        Con `generacion` (la vigente al iniciar la carga) se rechaza el
+        snapshot si hubo un `revertir()` desde entonces.
+        """
+        with self._lock_escritura:
+            if generacion is not None and generacion != self._generacion:
+                raise CargaDescartada(f"Snapshot {snapshot.version} descartado: se revirtió durante su carga")
+            if self._actual is not None:
+                self._historial.append(self._actual)
+            self._actual = snapshot
+        return snapshot
+
+    def cargar_en_segundo_plano(self, cargar, *args, **kwargs):
+        """
+        Construye un snapshot con `cargar(*args, **kwargs)` en segundo plano y
+        lo publica. Devuelve el Future: los errores de carga, o el rechazo por
+        un `revertir()` intermedio, quedan en `futuro.exception()`.
+        """
+        generacion = self._generacion
+        return self._cargador.submit(lambda: self.publicar(cargar(*args, **kwargs), generacion))
+
+    def revertir(self):
+        """Vuelve al snapshot anterior y descarta las cargas en curso"""
+        with self._lock_escritura:
+            if not self._historial:
+                raise RuntimeError("No hay snapshots anteriores a los que revertir")
+            self._generacion += 1
+            self._actual = self._historial.pop()
+            return self._actual
+
+    def versiones(self):
+        """Versiones en el historial (más antigua primero) y la vigente al final"""
+        vigente = [self._actual.version] if self._actual is not None else []
+        return [snapshot.version for snapshot in self._historial] + vigente
+
+    def cerrar(self):
+        self._cargador.shutdown(wait=True)
+
+
+def vigilar_archivos(almacen, rutas, cargar, intervalo=5.0, **kwargs):
+    """
+    Sondea la fecha de modificación de `rutas` y, si cambia alguna, recarga
+    en segundo plano con `cargar(*rutas, **kwargs)`. Una recarga fallida se
+    registra en el logger del módulo y se reintenta en el siguiente sondeo;
+    una descartada por `revertir()` no se reintenta hasta el próximo cambio.
+    Devuelve un `threading.Event`; llamar a `.set()` detiene la vigilancia.
+    """
+    detener = threading.Event()
+
+    def _marcas():
+        return tuple(os.path.getmtime(ruta) if os.path.exists(ruta) else None for ruta in rutas)
+
+    def _bucle():
+        ultimas = _marcas()
+        while not detener.wait(intervalo):
+            marcas = _marcas()
+            if marcas != ultimas and None not in marcas:
+                futuro = almacen.cargar_en_segundo_plano(cargar, *rutas, **kwargs)
+                try:
+                    futuro.result()
+                except CargaDescartada:
+                    pass
+                except Exception:
+                    logger.exception("Fallo al recargar el snapshot desde %s", rutas)
+                    continue
+                ultimas = marcas
+
+    threading.Thread(target=_bucle, name='vigilante-snapshots', daemon=True).start()
+    return detener
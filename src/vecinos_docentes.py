@@ -0,0 +1,97 @@
+"""
+Índice de similitud entre docentes para buscar reemplazos
+
+Cuando un docente abandona una materia a mitad de periodo se buscan los
+colegas con el perfil más parecido (competencias, herramientas, enfoque,
+idoneidad y experiencia) sobre los vectores estandarizados de cada docente.
+"""
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+from sklearn.preprocessing import StandardScaler
+
+from .config import COLUMNAS_SIMILITUD
+
+
+class IndiceSimilitudDocentes:
+    """Índice BallTree sobre los perfiles estandarizados de los docentes"""
+
+    def __init__(self, df_docentes, columnas=None, leaf_size=40, umbral_fuerza_bruta=2048):
+        self.columnas = list(columnas) if columnas is not None else list(COLUMNAS_SIMILITUD)
+        faltantes = [col for col in self.columnas if col not in df_docentes.columns]
+        if faltantes:
+            raise ValueError(f"Columnas no encontradas en docentes: {faltantes}")
+
+        self.df_docentes = df_docentes.reset_index(drop=True)
+        self.ids = self.df_docentes['id_docente'].to_numpy()
+        self.posiciones = pd.Series(np.arange(len(self.ids)), index=self.ids)
+        self.umbral_fuerza_bruta = umbral_fuerza_bruta
+
+        self.scaler = StandardScaler()
+        datos = self.df_docentes[self.columnas].fillna(0).to_numpy(dtype=np.float64)
+        self.vectores = self.scaler.fit_transform(datos)
+        self.arbol = BallTree(self.vectores, leaf_size=leaf_size)
+
+    def _mascara_candidatos(self, area=None, disponibilidad=None, carga_maxima=None):
+        """Máscara booleana con los docentes que cumplen los filtros"""
+        mascara = np.ones(len(self.ids), dtype=bool)
+
+        if area is not None:
+            areas = [area] if isinstance(area, str) else list(area)
+            mascara &= self.df_docentes['area_principal'].isin(areas).to_numpy()
+
+        # disponibilidad: {columna: valor mínimo}, p. ej. {'puede_horario_noche': 1}
+        for columna, minimo in (disponibilidad or {}).items():
+            mascara &= (self.df_docentes[columna].to_numpy() >= minimo)
+
+        if carga_maxima is not None:
+            mascara &= (self.df_docentes['carga_actual_creditos'].to_numpy() <= carga_maxima)
+
+        return mascara
+
+    def buscar_reemplazos(self, id_docente, k=5, area=None, disponibilidad=None, carga_maxima=None):
+        """
+        Devuelve los k docentes más parecidos a `id_docente`.
+
+        Los filtros se aplican sobre el docente candidato: `area` (una o varias
+        áreas principales), `disponibilidad` ({columna: valor mínimo}) y
+        `carga_maxima` de créditos actuales.
+        """
+        if id_docente not in self.posiciones.index:
+            raise KeyError(f"Docente '{id_docente}' no encontrado")
+
+        posicion = self.posiciones[id_docente]
+        consulta = self.vectores[posicion:posicion + 1]
+
+        mascara = self._mascara_candidatos(area, disponibilidad, carga_maxima)
+        mascara[posicion] = False
+        num_validos = int(mascara.sum())
+        k = min(k, num_validos)
+        if k == 0:
+            return self._resultado(np.array([], dtype=int), np.array([]))
+
+        if num_validos <= self.umbral_fuerza_bruta:
+            # Filtro muy selectivo: distancia exacta solo sobre los candidatos válidos
+            candidatos = np.flatnonzero(mascara)
+            distancias = np.linalg.norm(self.vectores[candidatos] - consulta, axis=1)
+            orden = np.argpartition(distancias, k - 1)[:k]
+            orden = orden[np.argsort(distancias[orden])]
+            return self._resultado(candidatos[orden], distancias[orden])
+
+        # Filtro poco selectivo: consultar el árbol ampliando k hasta llenar el cupo
+        k_consulta = min(len(self.ids), max(2 * (k + 1), int((k + 1) * len(self.ids) / num_validos)))
+        while True:
+            distancias, indices = self.arbol.query(consulta, k=k_consulta)
+            distancias, indices = distancias[0], indices[0]
+            validos = mascara[indices]
+            if validos.sum() >= k or k_consulta == len(self.ids):
+                return self._resultado(indices[validos][:k], distancias[validos][:k])
+            k_consulta = min(len(self.ids), k_consulta * 2)
+
+    def _resultado(self, indices, distancias):
+        columnas = [col for col in ['id_docente', 'nombres_completos', 'area_principal']
+                    if col in self.df_docentes.columns]
+        resultado = self.df_docentes.iloc[indices][columnas].reset_index(drop=True)
+        resultado['distancia'] = np.round(distancias, 4)
+        return resultado
@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, RAIZ)
+
+
+@pytest.fixture
+def catalogo_docentes():
+    """Primeros docentes de docentes.csv con las columnas derivadas de docentes_v3"""
+    df = pd.read_csv(os.path.join(RAIZ, 'docentes.csv'), encoding='utf-8').head(6)
+    df['experiencia_total'] = df['anios_experiencia_docente_total'] + df['anios_experiencia_industria']
+    df['ratio_cert_exp'] = df['total_certificaciones'] / df['experiencia_total'].clip(lower=1)
+    df['promedio_comp_tecnicas'] = df[['comp_programacion', 'comp_bases_datos', 'comp_software']].mean(axis=1)
+    return df
+
+
+@pytest.fixture
+def catalogo_materias():
+    return pd.read_csv(os.path.join(RAIZ, 'materias.csv'), encoding='utf-8').head(3)
@@ -0,0 +1,120 @@
+import pandas as pd
+import pytest
+from sklearn.base import clone
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import f1_score
+from sklearn.preprocessing import StandardScaler
+
+from src.actualizacion import actualizar_desde_periodo, actualizar_modelo, unir_resultados_periodo
+from src.config import FEATURE_COLS
+from src.data_loader import construir_asignaciones
+
+
+@pytest.fixture
+def datos():
+    X, y = make_classification(n_samples=600, n_features=len(FEATURE_COLS), n_informative=8,
+                               n_classes=3, random_state=0)
+    df = pd.DataFrame(X, columns=FEATURE_COLS)
+    df['efectividad_asignacion'] = y
+    historico, nuevo, holdout = df.iloc[:400], df.iloc[400:520], df.iloc[520:]
+
+    scaler = StandardScaler().fit(historico[FEATURE_COLS])
+    modelo = RandomForestClassifier(n_estimators=20, random_state=42)
+    modelo.fit(scaler.transform(historico[FEATURE_COLS]), historico['efectividad_asignacion'])
+    return df, modelo, scaler, nuevo, holdout
+
+
+def _llamar(datos, reentrenar, **kwargs):
+    _, modelo, scaler, nuevo, holdout = datos
+    return actualizar_modelo(modelo, scaler, nuevo, nuevo['efectividad_asignacion'],
+                             holdout, holdout['efectividad_asignacion'], reentrenar, **kwargs)
+
+
+def test_modo_incremental_conserva_scaler_y_agrega_arboles(datos):
+    def reentrenar(_):
+        raise AssertionError('No debe reentrenar desde cero')
+
+    modelo, scaler, reporte = _llamar(datos, reentrenar, arboles_extra=5, tolerancia=1.0)
+
+    assert reporte['modo'] == 'incremental'
+    assert scaler is datos[2]
+    assert len(modelo.estimators_) == 25
+    assert len(datos[1].estimators_) == 20
+
+
+def test_reentrenamiento_completo_usa_nuevo_scaler_y_excluye_holdout(datos):
+    df, modelo_original, _, _, holdout = datos
+    recibidos = {}
+
+    def reentrenar(indices_holdout):
+        recibidos['indices'] = indices_holdout
+        entrenamiento = df.drop(index=indices_holdout)
+        scaler = StandardScaler().fit(entrenamiento[FEATURE_COLS])
+        modelo = clone(modelo_original).fit(scaler.transform(entrenamiento[FEATURE_COLS]),
+                                            entrenamiento['efectividad_asignacion'])
+        recibidos['scaler'] = scaler
+        return modelo, scaler
+
+    modelo, scaler, reporte = _llamar(datos, reentrenar, tolerancia=-1.0)
+
+    assert reporte['modo'] == 'completo'
+    assert scaler is recibidos['scaler']
+    assert list(recibidos['indices']) == list(holdout.index)
+    esperado = f1_score(holdout['efectividad_asignacion'],
+                        modelo.predict(scaler.transform(holdout[FEATURE_COLS])),
+                        average='weighted', zero_division=0)
+    assert reporte['f1_despues'] == pytest.approx(esperado)
+
+
+def test_xgboost_n_estimators_refleja_rondas_totales():
+    xgboost = pytest.importorskip('xgboost')
+    X, y = make_classification(n_samples=300, n_features=len(FEATURE_COLS), n_informative=8,
+                               n_classes=3, random_state=1)
+    df = pd.DataFrame(X, columns=FEATURE_COLS)
+    scaler = StandardScaler().fit(df)
+    modelo = xgboost.XGBClassifier(n_estimators=10, max_depth=3).fit(scaler.transform(df), y)
+
+    actualizado, _, reporte = actualizar_modelo(
+        modelo, scaler, df.iloc[:200], y[:200], df.iloc[200:], y[200:],
+        reentrenar_completo=None, rondas_extra=5, tolerancia=1.0
+    )
+
+    assert reporte['modo'] == 'incremental'
+    assert actualizado.get_booster().num_boosted_rounds() == 15
+    assert actualizado.get_params()['n_estimators'] == 15
+
+
+def test_unir_resultados_periodo_agrega_features(catalogo_docentes, catalogo_materias):
+    docente, materia = catalogo_docentes['id_docente'].iloc[1], catalogo_materias['id_materia'].iloc[2]
+    resultados = pd.DataFrame({
+        'id_docente': [docente, docente],
+        'id_materia': [materia, materia],
+        'periodo_academico': ['2025-1', '2025-2'],
+        'efectividad_asignacion': [0, 2],
+        'tasa_aprobacion': [0.4, 0.9]
+    }, index=[10, 11])
+
+    unido = unir_resultados_periodo(resultados, catalogo_docentes, catalogo_materias)
+
+    par = construir_asignaciones(catalogo_docentes, catalogo_materias).set_index(['id_docente', 'id_materia'])
+    assert list(unido.index) == [10, 11]
+    assert list(unido['efectividad_asignacion']) == [0, 2]
+    assert list(unido['tasa_aprobacion']) == [0.4, 0.9]
+    assert unido[FEATURE_COLS].iloc[1].tolist() == par.loc[(docente, materia), FEATURE_COLS].tolist()
+
+
+def test_unir_resultados_periodo_rechaza_pares_desconocidos(catalogo_docentes, catalogo_materias):
+    resultados = pd.DataFrame({'id_docente': ['DOC_999'], 'id_materia': [catalogo_materias['id_materia'].iloc[0]],
+                               'periodo_academico': ['2025-1'], 'efectividad_asignacion': [1]})
+
+    with pytest.raises(ValueError, match='DOC_999'):
+        unir_resultados_periodo(resultados, catalogo_docentes, catalogo_materias)
+
+
+def test_actualizar_desde_periodo_sin_features(datos):
+    _, modelo, scaler, _, _ = datos
+    resultados = pd.DataFrame({'periodo_academico': ['2025-1'], 'efectividad_asignacion': [1]})
+
+    with pytest.raises(ValueError, match='unir_resultados_periodo'):
+        actualizar_desde_periodo(modelo, scaler, resultados, '2025-1', reentrenar_completo=None)
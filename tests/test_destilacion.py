@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from src.destilacion import fidelidad_por_materia
+
+
+def test_ranking_identico_tiene_fidelidad_perfecta():
+    ids = ['M1'] * 4 + ['M2'] * 4
+    maestro = np.array([0.9, 0.1, 0.5, 0.3, 0.2, 0.4, 0.8, 0.6])
+
+    fidelidad = fidelidad_por_materia(ids, maestro, maestro * 0.5, top_k=2)
+
+    assert list(fidelidad['id_materia']) == ['M1', 'M2']
+    assert fidelidad['spearman'].tolist() == pytest.approx([1.0, 1.0])
+    assert fidelidad['solapamiento_top_k'].tolist() == [1.0, 1.0]
+
+
+def test_ranking_invertido():
+    maestro = np.array([0.1, 0.2, 0.3, 0.4])
+
+    fidelidad = fidelidad_por_materia(['M1'] * 4, maestro, -maestro, top_k=2)
+
+    assert fidelidad.loc[0, 'spearman'] == pytest.approx(-1.0)
+    assert fidelidad.loc[0, 'solapamiento_top_k'] == 0.0
+
+
+def test_spearman_con_rankings_constantes():
+    ids = ['M1'] * 3 + ['M2'] * 3
+    maestro = np.array([0.5, 0.5, 0.5, 0.1, 0.2, 0.3])
+    estudiante = np.array([0.2, 0.2, 0.2, 0.4, 0.4, 0.4])
+
+    fidelidad = fidelidad_por_materia(ids, maestro, estudiante).set_index('id_materia')
+
+    assert fidelidad.loc['M1', 'spearman'] == 1.0
+    assert np.isnan(fidelidad.loc['M2', 'spearman'])
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from src.config import AREAS
+from src.escenarios import VARIABLES, MotorEscenarios
+
+
+def _rango(scores):
+    """Posición 0-based = docentes con score estrictamente mayor, por fuerza bruta con argsort"""
+    ordenados = scores[np.argsort(-scores, kind='stable')]
+    # Los empatados comparten la posición del primero del grupo
+    return np.array([np.flatnonzero(ordenados == score)[0] for score in scores])
+
+
+def _esperado(motor, pesos, pesos_base, top_k):
+    base = motor.idoneidad(pesos_base)[0]
+    top_base = np.argpartition(-base, top_k - 1, axis=0)[:top_k]
+    cambios = {}
+    for s, scores in enumerate(motor.idoneidad(pesos)):
+        for a in range(len(motor.areas)):
+            rango_base = _rango(base[:, a])[top_base[:, a]]
+            rango_escenario = _rango(scores[:, a])[top_base[:, a]]
+            top_escenario = np.argsort(-scores[:, a], kind='stable')[:top_k]
+            cambios[(s, a)] = (np.abs(rango_escenario - rango_base).mean(),
+                               np.intersect1d(top_escenario, top_base[:, a]).size / top_k)
+    return cambios
+
+
+@pytest.fixture
+def motor(catalogo_docentes):
+    return MotorEscenarios(catalogo_docentes)
+
+
+def test_cambio_de_posicion_con_empates(motor):
+    # Solo maestría/doctorado: scores binarios con muchos empates
+    pesos = np.zeros((3, len(AREAS), len(VARIABLES)))
+    pesos[0, :, VARIABLES.index('tiene_maestria')] = 1.0
+    pesos[1, :, VARIABLES.index('tiene_doctorado')] = 1.0
+    pesos[2, :, VARIABLES.index('tiene_maestria')] = 0.5
+    pesos[2, :, VARIABLES.index('tiene_doctorado')] = 0.5
+    pesos_base = np.zeros((len(AREAS), len(VARIABLES)))
+    pesos_base[:, VARIABLES.index('comp_programacion')] = 1.0
+
+    resultado = motor.evaluar(pesos, pesos_base, top_k=3, tamano_bloque=2)
+
+    esperado = _esperado(motor, pesos, pesos_base, top_k=3)
+    for fila in resultado['cambios_ranking'].itertuples():
+        s, a = int(fila.escenario.split('_')[1]) - 1, AREAS.index(fila.area)
+        assert fila.cambio_medio_posicion == pytest.approx(round(esperado[(s, a)][0], 2))
+
+
+def test_solapamiento_y_cambio_sin_empates(motor):
+    rng = np.random.default_rng(0)
+    pesos = rng.random((4, len(AREAS), len(VARIABLES)))
+    pesos_base = rng.random((len(AREAS), len(VARIABLES)))
+
+    resultado = motor.evaluar(pesos, pesos_base, top_k=3, tamano_bloque=3)
+
+    esperado = _esperado(motor, pesos, pesos_base, top_k=3)
+    assert len(resultado['cambios_ranking']) == 4 * len(AREAS)
+    for fila in resultado['cambios_ranking'].itertuples():
+        s, a = int(fila.escenario.split('_')[1]) - 1, AREAS.index(fila.area)
+        assert fila.cambio_medio_posicion == pytest.approx(round(esperado[(s, a)][0], 2))
+        assert fila.solapamiento_top_k == pytest.approx(esperado[(s, a)][1])
+
+
+def test_escenario_igual_al_base_no_cambia(motor):
+    pesos_base = np.random.default_rng(1).random((len(AREAS), len(VARIABLES)))
+
+    resultado = motor.evaluar(pesos_base[np.newaxis], pesos_base, top_k=3)
+
+    assert (resultado['cambios_ranking']['solapamiento_top_k'] == 1.0).all()
+    assert (resultado['cambios_ranking']['cambio_medio_posicion'] == 0.0).all()
+    assert (resultado['distribuciones'][['delta_Alta', 'delta_Media', 'delta_Baja']] == 0).all().all()
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+from src.config import CLASE_ALTA, FEATURE_COLS
+from src.explicaciones import ExplicadorRecomendaciones
+
+
+@pytest.fixture
+def filas():
+    X, y = make_classification(n_samples=200, n_features=len(FEATURE_COLS), n_informative=6,
+                               n_classes=3, random_state=0)
+    df = pd.DataFrame(X, columns=FEATURE_COLS)
+    df.insert(0, 'id_docente', [f'DOC_{i % 20:03d}' for i in range(len(df))])
+    df.insert(1, 'id_materia', [f'MAT_{i // 20:03d}' for i in range(len(df))])
+    return df, y
+
+
+@pytest.fixture
+def explicador(filas):
+    df, y = filas
+    scaler = StandardScaler().fit(df[FEATURE_COLS])
+    modelo = RandomForestClassifier(n_estimators=15, max_depth=5, random_state=0)
+    modelo.fit(scaler.transform(df[FEATURE_COLS]), y)
+    return ExplicadorRecomendaciones(modelo, scaler)
+
+
+def test_random_forest_suma_la_probabilidad(explicador, filas):
+    df, _ = filas
+    muestra = df.head(10)
+
+    explicacion = explicador.explicar(muestra)
+
+    esperado = explicador.modelo.predict_proba(explicador.scaler.transform(muestra[FEATURE_COLS]))[:, CLASE_ALTA]
+    assert explicacion['prediccion'].to_numpy() == pytest.approx(esperado)
+
+
+def test_cache_reutiliza_filas_iguales(explicador, filas, monkeypatch):
+    df, _ = filas
+    explicador.explicar(df.head(5))
+    llamadas = []
+    original = explicador._contribuciones_random_forest
+    monkeypatch.setattr(explicador, '_contribuciones_random_forest',
+                        lambda X: llamadas.append(len(X)) or original(X))
+
+    explicador.explicar(df.head(8))
+
+    assert llamadas == [3]
+
+
+def test_cache_detecta_features_cambiadas(explicador, filas):
+    df, _ = filas
+    antes = explicador.explicar(df.head(3))
+
+    recargado = df.head(3).copy()
+    recargado.loc[recargado.index[0], FEATURE_COLS] = recargado.loc[recargado.index[0], FEATURE_COLS] + 3
+    despues = explicador.explicar(recargado)
+
+    esperado = explicador.modelo.predict_proba(explicador.scaler.transform(recargado[FEATURE_COLS]))[:, CLASE_ALTA]
+    assert despues['prediccion'].to_numpy() == pytest.approx(esperado)
+    assert not np.allclose(antes.iloc[0][FEATURE_COLS], despues.iloc[0][FEATURE_COLS])
+    pd.testing.assert_frame_equal(antes.iloc[1:], despues.iloc[1:])
+
+
+def test_xgboost_suma_el_margen(filas):
+    xgboost = pytest.importorskip('xgboost')
+    df, y = filas
+    scaler = StandardScaler().fit(df[FEATURE_COLS])
+    X = scaler.transform(df[FEATURE_COLS])
+    modelo = xgboost.XGBClassifier(n_estimators=20, max_depth=3).fit(X, y)
+
+    explicacion = ExplicadorRecomendaciones(modelo, scaler).explicar(df.head(5))
+
+    margen = modelo.predict(X[:5], output_margin=True)[:, CLASE_ALTA]
+    assert explicacion['prediccion'].to_numpy() == pytest.approx(margen, abs=1e-4)
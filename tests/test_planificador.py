@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import GridSearchCV
+from sklearn.tree import DecisionTreeClassifier
+
+from src.planificador import TrabajoEntrenamiento, entrenar_con_presupuesto, repartir_nucleos
+
+
+@pytest.fixture
+def datos():
+    return make_classification(n_samples=300, n_features=8, n_informative=4, n_classes=3, random_state=0)
+
+
+def _trabajos():
+    return [
+        TrabajoEntrenamiento('random_forest', RandomForestClassifier(n_estimators=10, random_state=0),
+                             param_grid={'max_depth': [2, 4, 6]}, cv=3, scoring='f1_weighted'),
+        TrabajoEntrenamiento('arbol', DecisionTreeClassifier(random_state=0),
+                             param_grid={'max_depth': [2, 3, 4, 5]}, cv=3, scoring='f1_weighted'),
+    ]
+
+
+def test_repartir_nucleos_usa_todo_el_presupuesto():
+    trabajos = [TrabajoEntrenamiento('a', None, costo=20), TrabajoEntrenamiento('b', None, costo=1)]
+
+    assert repartir_nucleos(trabajos, 7) == [6, 1]
+    with pytest.raises(ValueError):
+        repartir_nucleos(trabajos, 1)
+
+
+def test_dos_busquedas_concurrentes_terminan(datos):
+    X, y = datos
+    resultado = {}
+    hilo = threading.Thread(
+        target=lambda: resultado.update(entrenar_con_presupuesto(_trabajos(), X, y, presupuesto=7)),
+        daemon=True
+    )
+    hilo.start()
+    hilo.join(timeout=120)
+
+    assert not hilo.is_alive(), 'entrenar_con_presupuesto no terminó (¿bloqueo de joblib?)'
+    assert list(resultado['reporte']['tareas']) == [9, 12]
+    assert sum(resultado['reporte']['nucleos']) == 7
+    assert resultado['modelos']['random_forest'].n_jobs == resultado['reporte']['nucleos'].iloc[0]
+
+
+def test_mejores_parametros_coinciden_con_grid_search(datos):
+    X, y = datos
+    resultado = entrenar_con_presupuesto(_trabajos(), X, y, presupuesto=2)
+
+    for trabajo in _trabajos():
+        referencia = GridSearchCV(trabajo.estimador, trabajo.param_grid, cv=trabajo.cv,
+                                  scoring=trabajo.scoring).fit(X, y)
+        busqueda = resultado['busquedas'][trabajo.nombre]
+        mejor = busqueda.loc[busqueda['rank_test_score'] == 1, 'params'].iloc[0]
+        assert mejor == referencia.best_params_
+        assert busqueda['mean_test_score'].to_numpy() == pytest.approx(referencia.cv_results_['mean_test_score'])
+        assert resultado['modelos'][trabajo.nombre].get_params()['max_depth'] == referencia.best_params_['max_depth']
+
+
+def test_trabajo_sin_busqueda(datos):
+    X, y = datos
+    trabajos = [TrabajoEntrenamiento('arbol', DecisionTreeClassifier(max_depth=3, random_state=0))]
+
+    resultado = entrenar_con_presupuesto(trabajos, X, y, presupuesto=1)
+
+    assert resultado['busquedas'] == {'arbol': None}
+    assert resultado['modelos']['arbol'].get_depth() <= 3
@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+from src.ranking import (COLOR_MATCH, COLOR_MATCH_PREFIERE, COLOR_SIN_MATCH, colores_ranking,
+                         construir_indice_ranking)
+from src.reportes import exportar_reportes
+
+
+@pytest.fixture
+def datos():
+    docentes = pd.DataFrame({
+        'id_docente': ['D1', 'D2', 'D3', 'D4'],
+        'nombres_completos': ['Ana', 'Luis', 'Eva', 'Raúl'],
+        'materias_preferidas': ['Bases de Datos|Redes', None, 'BASES DE DATOS', 'Redes']
+    })
+    materias = pd.DataFrame({
+        'id_materia': ['M1', 'M2', 'M3'],
+        'codigo': [' 101', '102 ', '103'],
+        'nombre': ['Bases de Datos', 'Redes', 'Sin pares'],
+        'area_conocimiento': ['Base de Datos', 'Computación', 'Software'],
+        'semestre': [3, 5, 1],
+        'creditos': [4, 3, 2],
+        'nivel_complejidad': ['Alto', 'Medio', 'Bajo']
+    })
+    asignaciones = pd.DataFrame({
+        'id_docente': ['D1', 'D2', 'D3', 'D4', 'D1', 'D2', 'D3', 'D4'],
+        'id_materia': ['M1'] * 4 + ['M2'] * 4,
+        'area_docente': ['Base de Datos', 'Software', 'Base de Datos', 'Computación'] * 2,
+        'match_area': [1, 0, 1, 0, 0, 0, 0, 1],
+        'score_idoneidad': [80.0, 40.0, 70.0, 55.0, 50.0, 45.0, 30.0, 90.0],
+        'prob_alta': [0.6, 0.9, 0.6, 0.1, 0.2, 0.3, 0.2, 0.8]
+    })
+    return asignaciones, docentes, materias
+
+
+def test_orden_por_prob_alta_con_empates_estables(datos):
+    indice = construir_indice_ranking(*datos, top_n=3)
+
+    assert sorted(indice) == ['101', '102']
+    recomendacion = indice['101']['recomendacion']
+    assert list(recomendacion['ID Docente']) == ['D2', 'D1', 'D3']
+    assert list(recomendacion['Pos']) == [1, 2, 3]
+    assert list(recomendacion['Prob.Alta']) == [90.0, 60.0, 60.0]
+    assert list(indice['102']['recomendacion']['ID Docente']) == ['D4', 'D2', 'D1']
+
+
+def test_preferencia_y_colores(datos):
+    recomendacion = construir_indice_ranking(*datos, top_n=4)['101']['recomendacion']
+
+    assert list(recomendacion['Prefiere']) == ['❌', '✅', '✅', '❌']
+    assert colores_ranking(recomendacion) == [COLOR_SIN_MATCH, COLOR_MATCH_PREFIERE, COLOR_MATCH_PREFIERE,
+                                              COLOR_SIN_MATCH]
+    recomendacion.loc[1, 'Prefiere'] = '❌'
+    assert colores_ranking(recomendacion)[1] == COLOR_MATCH
+
+
+def test_exportar_reportes(datos, tmp_path):
+    resumen = exportar_reportes(*datos, directorio=str(tmp_path), codigos=[102], max_procesos=1)
+
+    assert list(resumen['codigo']) == ['102']
+    for columna in ['csv', 'png', 'html']:
+        assert os.path.getsize(resumen.loc[0, columna]) > 0
+    assert list(pd.read_csv(resumen.loc[0, 'csv'])['ID Docente']) == ['D4', 'D2', 'D1', 'D3']
+    assert 'ranking_102.html' in (tmp_path / 'index.html').read_text(encoding='utf-8')
+
+    with pytest.raises(KeyError):
+        exportar_reportes(*datos, directorio=str(tmp_path), codigos=['999'], max_procesos=1)
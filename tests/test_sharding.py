@@ -0,0 +1,102 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.dummy import DummyClassifier
+from sklearn.preprocessing import StandardScaler
+
+from src import sharding
+from src.config import CARRERA_POR_DEFECTO, FEATURE_COLS
+from src.sharding import (combinar_directorio, docentes_de_carrera, particionar_por_carrera, shards_para_nodo,
+                          subdividir_shards)
+
+@pytest.fixture
+def docentes(catalogo_docentes):
+    return catalogo_docentes.head(4).assign(carreras=['Software | Redes', 'Software', 'Redes|Software', None])
+
+
+@pytest.fixture
+def proceso(monkeypatch, docentes):
+    """Estado de un proceso del pool con un modelo trivial"""
+    X = pd.DataFrame(np.random.default_rng(0).normal(size=(30, len(FEATURE_COLS))), columns=FEATURE_COLS)
+    monkeypatch.setattr(sharding, '_MODELO', DummyClassifier(strategy='uniform', random_state=0)
+                        .fit(X, np.arange(30) % 3))
+    monkeypatch.setattr(sharding, '_SCALER', StandardScaler().fit(X))
+    monkeypatch.setattr(sharding, '_DOCENTES', docentes)
+
+
+def test_materias_sin_carrera_van_a_la_carrera_por_defecto():
+    materias = pd.DataFrame({'id_materia': ['A', 'B', 'C'], 'carrera': ['Redes', None, float('nan')]})
+
+    shards = particionar_por_carrera(materias)
+
+    assert sorted(shards) == sorted(['Redes', CARRERA_POR_DEFECTO])
+    assert list(shards[CARRERA_POR_DEFECTO]['id_materia']) == ['B', 'C']
+
+
+def test_subdividir_y_repartir_cubre_todas_las_materias():
+    materias = pd.DataFrame({'id_materia': [f'M{i}' for i in range(10)]})
+    subshards = subdividir_shards({'Software': materias, 'Redes': materias.iloc[:3]}, max_materias=4)
+
+    assert [len(subshards[('Software', parte)]) for parte in range(3)] == [4, 4, 2]
+    asignadas = [clave for nodo in range(2) for clave in shards_para_nodo(subshards, nodo, 2)]
+    assert sorted(asignadas) == sorted(subshards)
+
+
+def test_docentes_de_carrera_ignora_espacios(docentes):
+    assert list(docentes_de_carrera(docentes, 'Redes').index) == [0, 2]
+
+
+def test_shard_con_docentes(proceso, catalogo_materias):
+    ranking, pares = sharding._procesar_shard('Software', catalogo_materias, top_n=2)
+
+    assert pares == 9
+    assert len(ranking) == 6
+    assert list(ranking['pos'].unique()) == [1, 2]
+
+
+def test_carrera_sin_docentes_da_ranking_vacio(proceso, catalogo_materias):
+    ranking, pares = sharding._procesar_shard('Ing. Civil', catalogo_materias, top_n=2)
+
+    assert pares == 0
+    assert ranking.empty
+    assert list(ranking.columns) == ['carrera', 'id_materia', 'pos'] + sharding.COLUMNAS_RANKING[1:]
+
+
+def _escribir_nodo(directorio, id_ejecucion, indice_nodo, archivos, total_nodos=2):
+    for archivo, carrera in archivos.items():
+        pd.DataFrame({
+            'carrera': [carrera], 'id_materia': [f'M{indice_nodo}'], 'pos': [1], 'id_docente': ['D1'],
+            'creditos': [4]
+        }).to_csv(directorio / archivo, index=False)
+    manifiesto = {'id_ejecucion': id_ejecucion, 'indice_nodo': indice_nodo, 'total_nodos': total_nodos,
+                  'max_materias_por_shard': 25, 'archivos': list(archivos)}
+    (directorio / f'{id_ejecucion}_manifiesto_nodo_{indice_nodo:03d}.json').write_text(json.dumps(manifiesto))
+
+
+def test_combinar_solo_usa_archivos_de_la_ejecucion(tmp_path):
+    _escribir_nodo(tmp_path, 'vieja', 0, {'vieja_shard_redes_000.csv': 'Redes'}, total_nodos=1)
+    _escribir_nodo(tmp_path, 'nueva', 0, {'nueva_shard_software_000.csv': 'Software'})
+    _escribir_nodo(tmp_path, 'nueva', 1, {'nueva_shard_software_001.csv': 'Software'})
+
+    resultado = combinar_directorio(tmp_path, 'nueva')
+
+    assert set(resultado['ranking']['carrera']) == {'Software'}
+    assert len(resultado['ranking']) == 2
+
+
+def test_combinar_falla_si_falta_un_nodo(tmp_path):
+    _escribir_nodo(tmp_path, 'nueva', 0, {'nueva_shard_software_000.csv': 'Software'})
+
+    with pytest.raises(FileNotFoundError, match=r'\[1\]'):
+        combinar_directorio(tmp_path, 'nueva')
+
+
+def test_nombres_de_archivo_distinguen_carreras_parecidas():
+    carreras = ['Ing. Civil', 'Ing Civil', 'Ingeniería', 'Ingenieria']
+
+    nombres = {sharding._nombre_archivo('r', carrera, 0) for carrera in carreras}
+
+    assert len(nombres) == len(carreras)
+    assert sharding._nombre_archivo('r', 'Ing. Civil', 0).startswith('r_shard_ing_civil_')
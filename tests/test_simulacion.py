@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.simulacion import simular_plan, unir_probabilidades
+
+
+@pytest.fixture
+def historico():
+    rng = np.random.default_rng(0)
+    clases = np.repeat([0, 1, 2], 20)
+    return pd.DataFrame({
+        'efectividad_asignacion': clases,
+        'tasa_aprobacion': np.clip(0.5 + 0.15 * clases + rng.normal(0, 0.05, len(clases)), 0, 1),
+        'promedio_calificaciones': np.clip(6 + clases + rng.normal(0, 0.5, len(clases)), 0, 10),
+        'num_estudiantes': rng.integers(20, 40, len(clases))
+    })
+
+
+@pytest.fixture
+def asignaciones():
+    return pd.DataFrame({
+        'id_docente': ['D1', 'D1', 'D2', 'D2'],
+        'id_materia': ['M1', 'M2', 'M1', 'M2'],
+        'prob_baja': [0.1, 0.6, 0.3, 0.2],
+        'prob_media': [0.2, 0.3, 0.3, 0.3],
+        'prob_alta': [0.7, 0.1, 0.4, 0.5]
+    })
+
+
+@pytest.fixture
+def plan(asignaciones):
+    return unir_probabilidades(pd.DataFrame({'id_docente': ['D1', 'D2'], 'id_materia': ['M1', 'M2']}),
+                               asignaciones)
+
+
+def test_misma_semilla_mismo_resultado(plan, historico):
+    primero = simular_plan(plan, historico, num_ensayos=2000, semilla=7, tamano_bloque=500)
+    segundo = simular_plan(plan, historico, num_ensayos=2000, semilla=7, tamano_bloque=500)
+    otro = simular_plan(plan, historico, num_ensayos=2000, semilla=8, tamano_bloque=500)
+
+    pd.testing.assert_frame_equal(primero['termino'], segundo['termino'])
+    pd.testing.assert_frame_equal(primero['materias'], segundo['materias'])
+    assert not primero['termino'].equals(otro['termino'])
+
+
+def test_proporcion_alta_sigue_las_probabilidades(plan, historico):
+    resultado = simular_plan(plan, historico, num_ensayos=20000, semilla=1)
+    materias = resultado['materias'].set_index('id_materia')
+
+    assert materias.loc['M1', 'proporcion_alta_media'] == pytest.approx(0.7, abs=0.02)
+    assert materias.loc['M2', 'proporcion_alta_media'] == pytest.approx(0.5, abs=0.02)
+
+
+def test_par_desconocido_lanza_error(asignaciones):
+    plan = pd.DataFrame({'id_docente': ['D1', 'D9'], 'id_materia': ['M1', 'M1']})
+
+    with pytest.raises(ValueError, match='D9'):
+        unir_probabilidades(plan, asignaciones)
+
+
+def test_plan_con_paralelos_del_mismo_par(asignaciones, historico):
+    plan = pd.DataFrame({'id_docente': ['D1', 'D1', 'D2'], 'id_materia': ['M1', 'M1', 'M2'],
+                         'paralelo': ['A', 'B', 'A']})
+
+    unido = unir_probabilidades(plan, asignaciones)
+
+    assert list(unido['paralelo']) == ['A', 'B', 'A']
+    assert list(unido['prob_alta']) == [0.7, 0.7, 0.5]
+    docentes = simular_plan(unido, historico, num_ensayos=200)['docentes']
+    assert list(docentes['id_docente']) == ['D1', 'D2']
+
+
+def test_asignaciones_con_pares_repetidos_lanzan_error(asignaciones):
+    plan = pd.DataFrame({'id_docente': ['D1'], 'id_materia': ['M1']})
+
+    with pytest.raises(ValueError, match='repetidos'):
+        unir_probabilidades(plan, pd.concat([asignaciones, asignaciones.head(1)]))
+
+
+def test_probabilidades_invalidas_lanzan_error(plan, historico):
+    con_nan = plan.assign(prob_alta=[0.7, np.nan])
+    sin_normalizar = plan.assign(prob_alta=[0.7, 0.9])
+
+    with pytest.raises(ValueError, match='NaN'):
+        simular_plan(con_nan, historico, num_ensayos=100)
+    with pytest.raises(ValueError, match='sumar 1'):
+        simular_plan(sin_normalizar, historico, num_ensayos=100)
+
+
+def test_materia_sin_estudiantes_no_divide_por_cero(plan, historico):
+    resultado = simular_plan(plan.assign(num_estudiantes=[0, 30]), historico, num_ensayos=500)
+
+    assert np.isfinite(resultado['materias'].drop(columns='id_materia').to_numpy()).all()
+    assert np.isfinite(resultado['termino'].drop(columns='metrica').to_numpy()).all()
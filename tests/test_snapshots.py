@@ -0,0 +1,104 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.snapshots import AlmacenSnapshots, CargaDescartada, Snapshot, vigilar_archivos
+
+
+def _snapshot(version):
+    asignaciones = pd.DataFrame({'id_docente': [1, 2], 'prob_alta': [0.8, 0.3]})
+    return Snapshot(version, None, None, pd.DataFrame(), pd.DataFrame(), asignaciones, np.zeros((2, 3)), {})
+
+
+@pytest.fixture
+def almacen():
+    almacen = AlmacenSnapshots(_snapshot('v1'))
+    yield almacen
+    almacen.cerrar()
+
+
+def test_publicar_y_revertir(almacen):
+    almacen.publicar(_snapshot('v2'))
+    almacen.publicar(_snapshot('v3'))
+    assert almacen.versiones() == ['v1', 'v2', 'v3']
+
+    assert almacen.revertir().version == 'v2'
+    assert almacen.actual.version == 'v2'
+    assert almacen.versiones() == ['v1', 'v2']
+
+
+def test_revertir_sin_historial(almacen):
+    with pytest.raises(RuntimeError):
+        almacen.revertir()
+
+
+def test_carga_fallida_no_cambia_el_vigente(almacen):
+    def cargar():
+        raise FileNotFoundError('modelo.pkl')
+
+    futuro = almacen.cargar_en_segundo_plano(cargar)
+
+    assert isinstance(futuro.exception(timeout=5), FileNotFoundError)
+    assert almacen.actual.version == 'v1'
+
+
+def test_carga_en_curso_se_descarta_tras_revertir(almacen):
+    almacen.publicar(_snapshot('v2'))
+    empezo, continuar = threading.Event(), threading.Event()
+
+    def cargar():
+        empezo.set()
+        continuar.wait(5)
+        return _snapshot('v3')
+
+    futuro = almacen.cargar_en_segundo_plano(cargar)
+    empezo.wait(5)
+    almacen.revertir()
+    continuar.set()
+
+    assert isinstance(futuro.exception(timeout=5), CargaDescartada)
+    assert almacen.actual.version == 'v1'
+
+
+def test_snapshot_no_comparte_datos_con_el_origen():
+    asignaciones = pd.DataFrame({'prob_alta': [0.8]})
+    X = np.ones((1, 2))
+    snapshot = Snapshot('v1', None, None, pd.DataFrame(), pd.DataFrame(), asignaciones, X, {})
+
+    asignaciones.loc[0, 'prob_alta'] = 0.0
+    X[0, 0] = 5.0
+
+    assert snapshot.df_asignaciones.loc[0, 'prob_alta'] == 0.8
+    assert snapshot.X[0, 0] == 1.0
+    with pytest.raises(ValueError):
+        snapshot.X[0, 0] = 2.0
+    with pytest.raises(AttributeError):
+        snapshot.version = 'v2'
+
+
+def test_vigilante_reintenta_tras_fallo(almacen, tmp_path):
+    ruta = tmp_path / 'modelo.pkl'
+    ruta.write_bytes(b'v1')
+    intentos = []
+
+    def cargar(_):
+        intentos.append(time.time())
+        if len(intentos) == 1:
+            raise OSError('escritura a medias')
+        return _snapshot('v2')
+
+    detener = vigilar_archivos(almacen, [str(ruta)], cargar, intervalo=0.02)
+    try:
+        time.sleep(0.05)
+        ruta.write_bytes(b'v2')
+        limite = time.time() + 5
+        while almacen.actual.version != 'v2' and time.time() < limite:
+            time.sleep(0.02)
+    finally:
+        detener.set()
+
+    assert almacen.actual.version == 'v2'
+    assert len(intentos) == 2
@@ -0,0 +1,63 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.vecinos_docentes import IndiceSimilitudDocentes
+
+RAIZ = os.path.join(os.path.dirname(__file__), '..')
+
+
+@pytest.fixture
+def docentes():
+    df = pd.read_csv(os.path.join(RAIZ, 'docentes.csv'), encoding='utf-8')
+    df['carga_actual_creditos'] = np.arange(len(df)) % 20
+    df['puede_horario_noche'] = np.arange(len(df)) % 2 == 0
+    return df
+
+
+def _referencia(indice, id_docente, mascara, k):
+    """k vecinos por fuerza bruta sobre todos los vectores"""
+    posicion = indice.posiciones[id_docente]
+    distancias = np.linalg.norm(indice.vectores - indice.vectores[posicion], axis=1)
+    distancias[~mascara] = np.inf
+    distancias[posicion] = np.inf
+    orden = np.argsort(distancias, kind='stable')[:k]
+    return list(indice.ids[orden]), distancias[orden]
+
+
+@pytest.mark.parametrize('umbral', [0, 10_000])
+def test_arbol_y_fuerza_bruta_coinciden_con_la_referencia(docentes, umbral):
+    indice = IndiceSimilitudDocentes(docentes, umbral_fuerza_bruta=umbral)
+    id_docente = docentes['id_docente'].iloc[7]
+
+    resultado = indice.buscar_reemplazos(id_docente, k=5)
+
+    ids, distancias = _referencia(indice, id_docente, np.ones(len(docentes), dtype=bool), 5)
+    assert list(resultado['id_docente']) == ids
+    assert resultado['distancia'].to_numpy() == pytest.approx(np.round(distancias, 4))
+
+
+@pytest.mark.parametrize('umbral', [0, 10_000])
+def test_filtros_se_aplican_al_candidato(docentes, umbral):
+    indice = IndiceSimilitudDocentes(docentes, umbral_fuerza_bruta=umbral)
+    id_docente = docentes['id_docente'].iloc[3]
+    areas = list(docentes['area_principal'].value_counts().index[:2])
+
+    resultado = indice.buscar_reemplazos(id_docente, k=4, area=areas, carga_maxima=12,
+                                         disponibilidad={'puede_horario_noche': 1})
+
+    mascara = (docentes['area_principal'].isin(areas) & (docentes['carga_actual_creditos'] <= 12)
+               & docentes['puede_horario_noche']).to_numpy()
+    ids, _ = _referencia(indice, id_docente, mascara, 4)
+    assert list(resultado['id_docente']) == ids
+    assert id_docente not in set(resultado['id_docente'])
+
+
+def test_sin_candidatos_y_docente_desconocido(docentes):
+    indice = IndiceSimilitudDocentes(docentes)
+
+    assert indice.buscar_reemplazos(docentes['id_docente'].iloc[0], area='Área inexistente').empty
+    with pytest.raises(KeyError):
+        indice.buscar_reemplazos('DOC_999')